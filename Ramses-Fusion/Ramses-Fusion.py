@@ -6,6 +6,61 @@ SETTINGS = ram.RamSettings.instance()
 ui = fu.UIManager
 disp = bmd.UIDispatcher(ui)
 
+ICONS_FOLDER = "Scripts:/Comp/Ramses-Fusion/icons/"
+# Size of the main buttons and their icons, shared by all buttons
+BUTTON_SIZE = [16, 16]
+
+# Main window buttons: ID, text, icon file
+MAIN_BUTTONS = (
+    ("RamsesButton", "Open Ramses Client", "ramses.png"),
+    ("SaveButton", "Save", "save.png"),
+    ("CommentButton", "Comment", "comment.png"),
+    ("IncrementalSaveButton", "Incremental Save", "incrementalSave.png"),
+    ("UpdateStatusButton", "Update Status/Publish", "updateStatus.png"),
+    ("PreviewButton", "CreatePreview", "preview.png"),
+    ("TemplateButton", "Save as Template", "template.png"),
+    ("SetupSceneButton", "Setup Scene", "setupScene.png"),
+    ("OpenButton", "Open", "open.png"),
+    ("RetrieveButton", "Retrieve Version", "retrieveVersion.png"),
+    ("PubSettingsButton", "Publishing Settings", "publishSettings.png"),
+    ("SettingsButton", "Settings", "Settings.png"),
+    ("AboutButton", "About", "Settings.png"),
+)
+
+# The static parts of the About window
+ABOUT_ALIGNMENT = [
+    {
+        "AlignHCenter": True,
+        "AlignTop": True,
+    }
+]
+ABOUT_LABELS = (
+    ("Info", "Ramses-Fusion was coded by Tobias Kummer for Overmind Studios. <p>Copyright &copy; 2024 Overmind Studios - Kummer & Gerhardt GbR.</p>"),
+    ("URL", 'Web: <a href="https://www.overmind-studios.de">Overmind Studios</a>'),
+)
+
+# Settings window fields: ID, settings attribute, type of the value, label, placeholder, row spacing
+SETTINGS_FIELDS = (
+    ("RamsesPathTxt", "ramsesClientPath", str, "Ramses executable path:", "Path to Ramses.exe", 5),
+    ("RamsesPortTxt", "ramsesClientPort", int, "Ramses client port:", "Port number", 0),
+)
+# Settings window height: a 30px row per field, plus the buttons and margins
+SETTINGS_HEIGHT = 40 + 30 * len(SETTINGS_FIELDS)
+
+
+def _mainButton(buttonId, text, icon):
+    return ui.Button(
+        {
+            "ID": buttonId,
+            "Text": "   " + text,
+            "Flat": False,
+            "IconSize": BUTTON_SIZE,
+            "MinimumSize": BUTTON_SIZE,
+            "Margin": 1,
+            "Icon": ui.Icon({"File": ICONS_FOLDER + icon}),
+        }
+    )
+
 
 def MainWindow():
     dlg = disp.AddWindow(
@@ -20,195 +75,7 @@ def MainWindow():
                     "Spacing": 0,
                 },
                 [  # Add your GUI elements here:
-                    ui.Button(
-                        {
-                            "ID": "RamsesButton",
-                            "Text": "   Open Ramses Client",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {"File": "Scripts:/Comp/Ramses-Fusion/icons/ramses.png"}
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "SaveButton",
-                            "Text": "   Save",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {"File": "Scripts:/Comp/Ramses-Fusion/icons/save.png"}
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "CommentButton",
-                            "Text": "   Comment",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/comment.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "IncrementalSaveButton",
-                            "Text": "   Incremental Save",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/incrementalSave.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "UpdateStatusButton",
-                            "Text": "   Update Status/Publish",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/updateStatus.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "PreviewButton",
-                            "Text": "   CreatePreview",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/preview.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "TemplateButton",
-                            "Text": "   Save as Template",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/template.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "SetupSceneButton",
-                            "Text": "   Setup Scene",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/setupScene.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "OpenButton",
-                            "Text": "   Open",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {"File": "Scripts:/Comp/Ramses-Fusion/icons/open.png"}
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "RetrieveButton",
-                            "Text": "   Retrieve Version",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/retrieveVersion.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "PubSettingsButton",
-                            "Text": "   Publishing Settings",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/publishSettings.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "SettingsButton",
-                            "Text": "   Settings",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/Settings.png"
-                                }
-                            ),
-                        }
-                    ),
-                    ui.Button(
-                        {
-                            "ID": "AboutButton",
-                            "Text": "   About",
-                            "Flat": False,
-                            "IconSize": [16, 16],
-                            "MinimumSize": [16, 16],
-                            "Margin": 1,
-                            "Icon": ui.Icon(
-                                {
-                                    "File": "Scripts:/Comp/Ramses-Fusion/icons/Settings.png"
-                                }
-                            ),
-                        }
-                    ),
+                    *[_mainButton(*button) for button in MAIN_BUTTONS],
                     ui.Label(
                         {
                             "ID": "RamsesVersion",
@@ -220,21 +87,14 @@ def MainWindow():
         ],
     )
 
-    itm = dlg.GetItems()
-
-    dlg.On.RamsesButton.Clicked = RunRamses
-    dlg.On.SaveButton.Clicked = _func
-    dlg.On.CommentButton.Clicked = _func
-    dlg.On.IncrementalSaveButton.Clicked = _func
-    dlg.On.UpdateStatusButton.Clicked = _func
-    dlg.On.PreviewButton.Clicked = _func
-    dlg.On.TemplateButton.Clicked = _func
-    dlg.On.SetupSceneButton.Clicked = _func
-    dlg.On.OpenButton.Clicked = _func
-    dlg.On.RetrieveButton.Clicked = _func
-    dlg.On.PubSettingsButton.Clicked = _func
-    dlg.On.SettingsButton.Clicked = SettingsWindow
-    dlg.On.AboutButton.Clicked = AboutWindow
+    # Buttons without a specific handler just close the window
+    handlers = {
+        "RamsesButton": RunRamses,
+        "SettingsButton": SettingsWindow,
+        "AboutButton": AboutWindow,
+    }
+    for buttonId, _, _ in MAIN_BUTTONS:
+        getattr(dlg.On, buttonId).Clicked = handlers.get(buttonId, _func)
 
     dlg.On.MainWin.Close = _func
 
@@ -248,7 +108,7 @@ def SettingsWindow(ev):
         {
             "WindowTitle": "Ramses Settings",
             "ID": "SettingsWin",
-            "Geometry": [200, 200, 550, 100],
+            "Geometry": [200, 200, 550, SETTINGS_HEIGHT],
         },
         [
             ui.VGroup(
@@ -256,38 +116,25 @@ def SettingsWindow(ev):
                     "Spacing": 5,
                 },
                 [
-                    ui.HGroup(
-                        {
-                            "Spacing": 5,
-                        },
-                        [
-                            ui.Label({"Text": "Ramses executable path:"}),
-                            ui.LineEdit(
-                                {
-                                    "ID": "RamsesPathTxt",
-                                    "Weight": 2,
-                                    "Text": SETTINGS.ramsesClientPath,
-                                    "PlaceholderText": "Path to Ramses.exe",
-                                }
-                            ),
-                        ],
-                    ),
-                    ui.HGroup(
-                        {
-                            "Spacing": 0,
-                        },
-                        [
-                            ui.Label({"Text": "Ramses client port:"}),
-                            ui.LineEdit(
-                                {
-                                    "ID": "RamsesPortTxt",
-                                    "Weight": 2,
-                                    "Text": str(SETTINGS.ramsesClientPort),
-                                    "PlaceholderText": "Port number",
-                                }
-                            ),
-                        ],
-                    ),
+                    *[
+                        ui.HGroup(
+                            {
+                                "Spacing": spacing,
+                            },
+                            [
+                                ui.Label({"Text": label}),
+                                ui.LineEdit(
+                                    {
+                                        "ID": fieldId,
+                                        "Weight": 2,
+                                        "Text": str(getattr(SETTINGS, attribute)),
+                                        "PlaceholderText": placeholder,
+                                    }
+                                ),
+                            ],
+                        )
+                        for fieldId, attribute, _, label, placeholder, spacing in SETTINGS_FIELDS
+                    ],
                     ui.HGroup(
                         {
                             "Spacing": 5,
@@ -315,8 +162,8 @@ def SettingsWindow(ev):
     itm = dlg.GetItems()
 
     def SaveSettings(ev):
-        SETTINGS.ramsesClientPort = int(itm["RamsesPortTxt"].Text)
-        SETTINGS.ramsesClientPath = str(itm["RamsesPathTxt"].Text)
+        for fieldId, attribute, valueType, _, _, _ in SETTINGS_FIELDS:
+            setattr(SETTINGS, attribute, valueType(itm[fieldId].Text))
         SETTINGS.save()
 
     dlg.On.SettingsWin.Close = _func
@@ -341,34 +188,18 @@ def AboutWindow(ev):
                     "Spacing": 0,
                 },
                 [
-                    ui.Label(
-                        {
-                            "ID": "Info",
-                            "Text": "Ramses-Fusion was coded by Tobias Kummer for Overmind Studios. <p>Copyright &copy; 2024 Overmind Studios - Kummer & Gerhardt GbR.</p>",
-                            "Alignment": [
-                                {
-                                    "AlignHCenter": True,
-                                    "AlignTop": True,
-                                }
-                            ],
-                            "WordWrap": True,
-                            "OpenExternalLinks": True,
-                        }
-                    ),
-                    ui.Label(
-                        {
-                            "ID": "URL",
-                            "Text": 'Web: <a href="https://www.overmind-studios.de">Overmind Studios</a>',
-                            "Alignment": [
-                                {
-                                    "AlignHCenter": True,
-                                    "AlignTop": True,
-                                }
-                            ],
-                            "WordWrap": True,
-                            "OpenExternalLinks": True,
-                        }
-                    ),
+                    *[
+                        ui.Label(
+                            {
+                                "ID": labelId,
+                                "Text": text,
+                                "Alignment": ABOUT_ALIGNMENT,
+                                "WordWrap": True,
+                                "OpenExternalLinks": True,
+                            }
+                        )
+                        for labelId, text in ABOUT_LABELS
+                    ],
                     ui.VGap(),
                     ui.Button(
                         {
@@ -380,8 +211,6 @@ def AboutWindow(ev):
             )
         ],
     )
-    itm = dlg.GetItems()
-
     dlg.On.AboutCloseButton.Clicked = _func
 
     dlg.On.AboutWin.Close = _func
@@ -399,9 +228,6 @@ def _func(ev):
     disp.ExitLoop()
 
 
-for project in RAMSES.projects():
-    print(project.framerate())
-
 print(
     "Comp dependency: "
     + str(ram.RamProject.fromPath(comp.GetAttrs()["COMPS_FileName"]))
@@ -17,7 +17,7 @@
 #
 #======================= END GPL LICENSE BLOCK ========================
 
-import socket, json
+import socket, json, time
 
 from .logger import log
 from .constants import ItemType, LogLevel, Log, StepType
@@ -33,6 +33,8 @@ class RamDaemonInterface( object ):
     """
     
     _instance = None
+    # The classes for each object type, see __objectClasses()
+    _objectClasses = None
 
     @staticmethod
     def checkReply( obj ):
@@ -48,6 +50,8 @@ class RamDaemonInterface( object ):
             cls._instance = cls.__new__(cls)
             cls._port = RamSettings.instance().ramsesClientPort
             cls._address = 'localhost'
+            # Last time a user was found logged in the daemon
+            cls._userCheckTime = 0
 
         return cls._instance
 
@@ -93,20 +97,10 @@ class RamDaemonInterface( object ):
         Returns: list of RamObject.
         """
 
-        from .ram_asset import RamAsset
-        from .ram_assetgroup import RamAssetGroup
-        from .ram_filetype import RamFileType
-        from .ram_item import RamItem
-        from .ram_object import RamObject
-        from .ram_pipe import RamPipe
-        from .ram_pipefile import RamPipeFile
-        from .ram_project import RamProject
-        from .ram_sequence import RamSequence
-        from .ram_shot import RamShot
-        from .ram_state import RamState
-        from .ram_status import RamStatus
-        from .ram_step import RamStep
-        from .ram_user import RamUser
+        objectClass = self.__objectClasses().get(objectType)
+        if objectClass is None:
+            log("Unknown object type: " + objectType, LogLevel.Critical)
+            return []
 
         if not self.__checkUser():
             self.__noUserReply('getProjects')
@@ -124,36 +118,7 @@ class RamDaemonInterface( object ):
         for obj in objs:
             uuid = obj.get("uuid", "")
             data = obj.get("data", {})
-            if objectType == "RamObject":
-                o = RamObject( uuid, data=data)
-            elif objectType == "RamAsset":
-                o = RamAsset( uuid, data=data)
-            elif objectType == "RamAssetGroup":
-                o = RamAssetGroup( uuid, data=data)
-            elif objectType == "RamFileType":
-                o = RamFileType( uuid, data=data)
-            elif objectType == "RamItem":
-                o = RamItem( uuid, data=data)
-            elif objectType == "RamPipe":
-                o = RamPipe( uuid, data=data)
-            elif objectType == "RamPipeFile":
-                o = RamPipeFile( uuid, data=data)
-            elif objectType == "RamProject":
-                o = RamProject( uuid, data=data)
-            elif objectType == "RamSequence":
-                o = RamSequence( uuid, data=data)
-            elif objectType == "RamShot":
-                o = RamShot( uuid, data=data)
-            elif objectType == "RamState":
-                o = RamState( uuid, data=data)
-            elif objectType == "RamStatus":
-                o = RamStatus( uuid, data=data)
-            elif objectType == "RamStep":
-                o = RamStep( uuid, data=data)
-            elif objectType == "RamUser":
-                o = RamUser( uuid, data=data)
-            if o:
-                objects.append(o)
+            objects.append( objectClass( uuid, data=data ) )
         return objects
 
     def getProjects(self):
@@ -447,7 +412,12 @@ class RamDaemonInterface( object ):
         
         Returns: dict.
         """
-        
+
+        # An empty path (e.g. an unsaved file) can't belong to any object,
+        # don't query the daemon
+        if not path:
+            return ""
+
         if not self.__checkUser():
             self.__noUserReply('uuidFromPath')
             return ""
@@ -513,6 +483,47 @@ class RamDaemonInterface( object ):
             ),
             65536 )
 
+    @classmethod
+    def __objectClasses( cls ):
+        """The class to instantiate for each object type.
+        Imported and built on first use only: these modules import this one"""
+
+        if cls._objectClasses is not None:
+            return cls._objectClasses
+
+        from .ram_asset import RamAsset
+        from .ram_assetgroup import RamAssetGroup
+        from .ram_filetype import RamFileType
+        from .ram_item import RamItem
+        from .ram_object import RamObject
+        from .ram_pipe import RamPipe
+        from .ram_pipefile import RamPipeFile
+        from .ram_project import RamProject
+        from .ram_sequence import RamSequence
+        from .ram_shot import RamShot
+        from .ram_state import RamState
+        from .ram_status import RamStatus
+        from .ram_step import RamStep
+        from .ram_user import RamUser
+
+        cls._objectClasses = {
+            "RamObject": RamObject,
+            "RamAsset": RamAsset,
+            "RamAssetGroup": RamAssetGroup,
+            "RamFileType": RamFileType,
+            "RamItem": RamItem,
+            "RamPipe": RamPipe,
+            "RamPipeFile": RamPipeFile,
+            "RamProject": RamProject,
+            "RamSequence": RamSequence,
+            "RamShot": RamShot,
+            "RamState": RamState,
+            "RamStatus": RamStatus,
+            "RamStep": RamStep,
+            "RamUser": RamUser,
+        }
+        return cls._objectClasses
+
     def __buildQuery(self, query):
         """Builds a query from a list of args
 
@@ -528,16 +539,12 @@ class RamDaemonInterface( object ):
         if isinstance(query, str):
             return query
 
-        queryList = []
-
-        for arg in query:
-            if isinstance(arg, str):
-                if arg:
-                    queryList.append(arg)
-            else:
-                queryList.append( "=".join(arg) )
-
-        return "&".join(queryList)
+        # Empty str arguments are skipped, key/value pairs are always kept
+        return "&".join([
+            arg if isinstance(arg, str) else "=".join(arg)
+            for arg in query
+            if arg
+        ])
 
     def __post(self, query, bufsize = 0):
         """Posts a query and returns a dict corresponding to the json reply
@@ -564,6 +571,7 @@ class RamDaemonInterface( object ):
         try:
             s.connect((self._address, self._port))
         except Exception as e: #pylint: disable=broad-except
+            self._userCheckTime = 0
             log("Daemon can't be reached", LogLevel.Debug)
             log(str(e), LogLevel.Critical)
             ramses = Ramses.instance()
@@ -589,7 +597,8 @@ class RamDaemonInterface( object ):
             }
             return obj
 
-        log (str(data), LogLevel.DataReceived )
+        # The reply is converted to a string by log() only if it's printed
+        log (data, LogLevel.DataReceived )
 
         if not obj['accepted']: log("Unknown Ramses Daemon query: " + obj['query'], LogLevel.Critical)
         if not obj['success']: log("Warning: the Ramses Daemon could not reply to the query: " + obj['query'], LogLevel.Critical)       
@@ -619,6 +628,12 @@ class RamDaemonInterface( object ):
         return False
 
     def __checkUser(self):
+        # Each query checks the user first; don't ping the daemon again
+        # if the user was found less than 2 seconds ago
+        # (same timeout as the RamObject data cache)
+        if time.time() - self._userCheckTime < 2:
+            return True
+
         data = self.ping()
 
         if data is None:
@@ -637,6 +652,9 @@ class RamDaemonInterface( object ):
         else:
             return False
 
+        if ok:
+            self._userCheckTime = time.time()
+
         return ok
 
     def __noUserReply(self, query):
@@ -18,6 +18,7 @@
 #======================= END GPL LICENSE BLOCK ========================
 
 import os, re
+from functools import lru_cache
 from datetime import datetime
 from .constants import ItemType, LogLevel
 from .utils import intToStr
@@ -27,9 +28,93 @@ from .logger import log
 # Keep the settings at hand
 settings = RamSettings.instance()
 
+# The restored version block in resources, compiled once
+RE_RESTORED = re.compile('\\+restored-v(\\d+)\\+')
+
+@lru_cache(maxsize=4096)
+def _parseFileName( regex, name ):
+    """Low-level, undocumented. Parses a name using the naming scheme regex; results are cached by name.
+    The same names are parsed again and again when scanning folders.
+
+    Returns the tuple (project, ramType, shortName, step, resource, isRestoredVersion, restoredVersion, state, version, extension)
+    or None if the name does not follow the naming scheme."""
+
+    splitRamsesName = regex.match( name )
+
+    if splitRamsesName is None:
+        return None
+
+    # Get all the blocks at once; the optional ones are None when missing
+    project, ramType, block3, block4, resourceBlock, stateBlock, versionBlock, extensionBlock = splitRamsesName.groups()
+    shortName = ""
+    step = ""
+    resource = ""
+    isRestoredVersion = False
+    restoredVersion = -1
+    state = ""
+    version = -1
+    extension = ""
+
+    if ramType in (ItemType.ASSET, ItemType.SHOT):
+        shortName = block3
+        if block4 is not None:
+            step = block4
+    else:
+        step = block3
+        if block4 is not None:
+            shortName = block4
+
+    if resourceBlock is not None:
+        resource = resourceBlock
+        restoredInfo = RE_RESTORED.match( resource )
+        if restoredInfo:
+            isRestoredVersion = True
+            restoredVersion = int( restoredInfo.group(1) )
+            resource = RE_RESTORED.sub( "", resource )
+
+    if stateBlock is not None:
+        state = stateBlock
+
+    if versionBlock is not None:
+        version = int ( versionBlock )
+
+    if extensionBlock is not None:
+        extension = extensionBlock
+
+    return (
+        project,
+        ramType,
+        shortName,
+        step,
+        resource,
+        isRestoredVersion,
+        restoredVersion,
+        state,
+        version,
+        extension
+    )
+
 class RamFileInfo():
     """A class to help generating filenames or getting data from filenames"""
 
+    # An info is created for each file when listing folders: no need for a __dict__
+    __slots__ = (
+        'project',
+        'ramType',
+        'shortName',
+        'step',
+        'resource',
+        'state',
+        'version',
+        'extension',
+        'isRestoredVersion',
+        'restoredVersion',
+        'date',
+        '__stateShortNames',
+        '__fileName',
+        '__filePath',
+    )
+
     # Cache stuff
     __nameRe = None # The regexp to handle names. Initialized the first time it's needed
 
@@ -155,39 +240,22 @@ class RamFileInfo():
 
         self.__fileName = name
 
-        splitRamsesName = re.match(self.__getRamsesNameRegEx(), name)
-
-        if splitRamsesName is None:
+        parsed = _parseFileName( self.__getRamsesNameRegEx(), name )
+        if parsed is None:
             return False
 
-        self.project = splitRamsesName.group(1)
-        self.ramType = splitRamsesName.group(2)
-
-        if self.ramType in (ItemType.ASSET, ItemType.SHOT):
-            self.shortName = splitRamsesName.group(3)
-            if splitRamsesName.group(4) is not None:
-                self.step = splitRamsesName.group(4)
-        else:
-            self.step = splitRamsesName.group(3)
-            if splitRamsesName.group(4) is not None:
-                self.shortName = splitRamsesName.group(4)
-
-        if splitRamsesName.group(5) is not None:
-            self.resource = splitRamsesName.group(5)
-            restoredInfo = re.match( '\\+restored-v(\\d+)\\+', self.resource)
-            if restoredInfo:
-                self.isRestoredVersion = True
-                self.restoredVersion = int( restoredInfo.group(1) )
-                self.resource = re.sub( '\\+restored-v\\d+\\+', "", self.resource)
-
-        if splitRamsesName.group(6) is not None:
-            self.state = splitRamsesName.group(6)
-
-        if splitRamsesName.group(7) is not None:
-            self.version = int ( splitRamsesName.group(7) )
-
-        if splitRamsesName.group(8) is not None:
-            self.extension = splitRamsesName.group(8)
+        (
+            self.project,
+            self.ramType,
+            self.shortName,
+            self.step,
+            self.resource,
+            self.isRestoredVersion,
+            self.restoredVersion,
+            self.state,
+            self.version,
+            self.extension
+        ) = parsed
 
         return True
 
@@ -203,11 +271,13 @@ class RamFileInfo():
         # First get information specific to files or innest folder, won't be found in parent folders:
         self.setFileName( name )
 
-        # The date of the file
-        if os.path.exists( path ):
+        # The date of the file; stat it only once instead of checking if it exists first
+        try:
             self.date = datetime.fromtimestamp(
                 os.path.getmtime( path )
             )
+        except OSError:
+            pass
 
         # If this is a project path, let's just use the project short name
         if RamFileManager.isProjectFolder( path):
@@ -267,8 +337,9 @@ class RamFileInfo():
                 self.project = nm.project
                 break
 
-    def copy( self ):
-        """Returns a copy of the current instance"""
+    def copy( self, filePath=None ):
+        """Returns a copy of the current instance.
+        If filePath is given, it is used as the path of the copy, without parsing it"""
 
         nm = RamFileInfo()
         nm.project = self.project
@@ -282,6 +353,9 @@ class RamFileInfo():
         nm.__stateShortNames = self.__stateShortNames
         nm.__fileName = self.__fileName
         nm.__filePath = self.__filePath
+        if filePath is not None:
+            nm.__filePath = filePath
+            nm.__fileName = os.path.basename( filePath )
 
         return nm
 
@@ -17,7 +17,7 @@
 #
 #======================= END GPL LICENSE BLOCK ========================
 
-import os, re, shutil, codecs
+import os, re, shutil, time
 from threading import Thread
 from .ram_settings import RamSettings
 from .utils import intToStr
@@ -28,30 +28,128 @@ from .file_info import RamFileInfo
 # Keep the settings at hand
 settings = RamSettings.instance()
 
+# Folder names, built once instead of on each call
+PROJECT_FOLDER_NAMES = (
+    FolderNames.admin,
+    FolderNames.preProd,
+    FolderNames.prod,
+    FolderNames.postProd,
+    FolderNames.assets,
+    FolderNames.shots,
+    FolderNames.export
+)
+RESERVED_FOLDER_NAMES = (
+    FolderNames.versions,
+    FolderNames.publish,
+    FolderNames.preview
+)
+
+# Naming scheme regexes, compiled once
+RE_NAME = re.compile('^[ a-zA-Z0-9+-]{1,256}$', re.IGNORECASE)
+RE_SHORT_NAME = re.compile('^[a-z0-9+-]{1,10}$', re.IGNORECASE)
+RE_ITEM_FOLDER_NAME = re.compile('^([a-z0-9+-]{1,10})_([ASG])_([a-z0-9+-]{1,10})$', re.IGNORECASE)
+
+# The sort key of invalid version folders
+LOWEST_VERSION = float('-inf')
+
+# Forbidden characters in resources and their replacement
+RESOURCE_TRANSLATION = str.maketrans({
+    '"' : ' ',
+    '_' : '-',
+    '[' : '-',
+    ']' : '-',
+    '{' : '-',
+    '}' : '-',
+    '(' : '-',
+    ')' : '-',
+    '\'': ' ',
+    '`' : ' ',
+    '.' : '-',
+    '/' : '-',
+    '\\' : '-',
+    ',' : ' '
+    })
+
 class RamFileManager():
     """A Class to help managing files using the Ramses naming scheme"""
 
-    # Cache stuff
+    # Copies running in the background
     __writingThreads = []
 
+    # Cache stuff
+    # Results of isProjectFolder: { folderPath: (checkTime, isProjectFolder) }
+    __projectFolders = {}
+
     @staticmethod
     def copy( originPath, destinationPath, separateThread=True ):
         """Copies a file, in a separated thread if separateThread is True"""
         if separateThread:
-            t = Thread( target=RamFileManager.copy, args=(originPath, destinationPath, False) )
+            # Start the copy right away: callers may overwrite the origin file just after
+            t = Thread( target=RamFileManager.__threadCopy, args=(originPath, destinationPath) )
             log( "Launching parallel copy of a file.", LogLevel.Debug )
             t.start()
             RamFileManager.__writingThreads.append(t)
         else:
             log("Starting copy of: " + os.path.basename( originPath ) + "\nto: " + destinationPath, LogLevel.Debug )
-            shutil.copy2( originPath, destinationPath )
+            RamFileManager.__copyFile( originPath, destinationPath )
             log("Finished writing: " + os.path.basename( destinationPath ), LogLevel.Debug )
 
+    @staticmethod
+    def __threadCopy( originPath, destinationPath ):
+        """Copies a file from a separated thread.
+        Nobody waits for the result there: log any exception instead"""
+        try:
+            RamFileManager.copy( originPath, destinationPath, False )
+        except Exception as e: #pylint: disable=broad-except
+            log( "I can't copy " + originPath + " to " + destinationPath + ": " + str(e), LogLevel.Critical )
+
+    @staticmethod
+    def __copyFile( originPath, destinationPath ):
+        """Copies the file and its metadata, like shutil.copy2.
+        Tries os.copy_file_range first where available (Linux), which lets the file system
+        clone the data (reflinks, server-side copies on NFS) without going through user space.
+        On Windows, CopyFileW does the same (server-side copies on SMB shares) and keeps the metadata."""
+        if os.name == 'nt':
+            try:
+                import ctypes
+                if ctypes.windll.kernel32.CopyFileW( originPath, destinationPath, False ):
+                    return
+                log( "Fast copy failed, falling back to a standard copy: " + str(ctypes.WinError()), LogLevel.Debug )
+            except (ImportError, AttributeError, OSError) as e:
+                log( "Fast copy unavailable, falling back to a standard copy: " + str(e), LogLevel.Debug )
+        elif hasattr( os, 'copy_file_range' ):
+            try:
+                with open( originPath, 'rb' ) as src, open( destinationPath, 'wb' ) as dst:
+                    remaining = os.fstat( src.fileno() ).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range( src.fileno(), dst.fileno(), remaining )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                # Some file systems stop early: only trust a complete copy
+                if remaining == 0:
+                    shutil.copystat( originPath, destinationPath )
+                    return
+                log( "Fast copy stopped before the end of the file, falling back to a standard copy.", LogLevel.Debug )
+            except OSError as e:
+                log( "Fast copy unavailable, falling back to a standard copy: " + str(e), LogLevel.Debug )
+        # shutil already uses sendfile/fcopyfile or large buffers depending on the platform
+        shutil.copy2( originPath, destinationPath )
+
     @staticmethod
     def waitFiles():
         """Waits for all writing operations to finish"""
-        for t in RamFileManager.__writingThreads:
-            t.join()
+        # Threads are only appended and popped, which are atomic operations:
+        # the list does not need a lock. Popping them also forgets the finished
+        # threads, so they are joined only once.
+        while RamFileManager.__writingThreads:
+            RamFileManager.__writingThreads.pop().join()
+
+    @staticmethod
+    def ensureFolder( folderPath ):
+        """Creates the folder if it does not exist yet.
+        Checked each time: the folder may have been removed during the session"""
+        os.makedirs( folderPath, exist_ok=True )
 
     @staticmethod
     def getRamsesFiles( folderPath, resource = None ):
@@ -77,24 +175,28 @@ class RamFileManager():
     def isAssetStep( stepShortName, assetsPath ):
         """Checks the production type of the given step in the assets folder"""
         # Try to find the type from shots or assets folders
+        # scandir entries know if they're folders without another stat call
         if os.path.isdir( assetsPath ):
             # each folder is an asset group
-            for folder in os.listdir( assetsPath ):
-                groupPath = assetsPath + "/" + folder 
-                # Check only dirs
-                if not os.path.isdir( groupPath ):
-                    continue
-                # each folder is an asset
-                for assetFolder in os.listdir( groupPath ):
-                    assetPath = groupPath + '/' + assetFolder
-                    if not os.path.isdir( assetPath ):
+            with os.scandir( assetsPath ) as groups:
+                for group in groups:
+                    # Check only dirs
+                    if not group.is_dir():
                         continue
-                    # each folder is a step working folder in the asset
-                    for stepFolder in os.listdir( assetPath ):
-                        nm = RamFileInfo()
-                        if nm.setFileName( stepFolder ):
-                            if nm.step == stepShortName:
-                                return True
+                    # each folder is an asset
+                    with os.scandir( group.path ) as assets:
+                        for asset in assets:
+                            if not asset.is_dir():
+                                continue
+                            # each folder is a step working folder in the asset
+                            for stepFolder in os.listdir( asset.path ):
+                                # The step must be in the name, don't parse it otherwise
+                                if stepShortName not in stepFolder:
+                                    continue
+                                nm = RamFileInfo()
+                                if nm.setFileName( stepFolder ):
+                                    if nm.step == stepShortName:
+                                        return True
         return False
 
     @staticmethod
@@ -102,16 +204,19 @@ class RamFileManager():
         """Checks the production type of the given step in the shots folder"""
         if os.path.isdir( shotsPath ):
             #  each folder is a shot
-            for shotFolder in os.listdir( shotsPath ):
-                shotPath = shotsPath + '/' + shotFolder
-                if not os.path.isdir( shotPath ):
-                    continue
-                # each folder is a step working folder in the shot
-                for shotFolder in os.listdir( shotPath ):
-                    nm = RamFileInfo()
-                    if nm.setFileName( shotFolder ):
-                        if nm.step == shotShortName:
-                            return True
+            with os.scandir( shotsPath ) as shots:
+                for shot in shots:
+                    if not shot.is_dir():
+                        continue
+                    # each folder is a step working folder in the shot
+                    for shotFolder in os.listdir( shot.path ):
+                        # The step must be in the name, don't parse it otherwise
+                        if shotShortName not in shotFolder:
+                            continue
+                        nm = RamFileInfo()
+                        if nm.setFileName( shotFolder ):
+                            if nm.step == shotShortName:
+                                return True
         return False
 
     @staticmethod
@@ -132,6 +237,28 @@ class RamFileManager():
     @staticmethod
     def isProjectFolder( folderPath ):
         """Checks if the given folder is the project root"""
+        # This is called for each parent folder each time a path is parsed:
+        # keep the results for 2 seconds, like the object data, instead of listing the folders again
+        now = time.time()
+        cached = RamFileManager.__projectFolders.get( folderPath )
+        if cached is not None and now - cached[0] < 2:
+            return cached[1]
+
+        # Forget the expired results from time to time, not to keep every folder ever parsed
+        if len( RamFileManager.__projectFolders ) >= 1000:
+            RamFileManager.__projectFolders = {
+                folder: result
+                for folder, result in RamFileManager.__projectFolders.items()
+                if now - result[0] < 2
+            }
+
+        isProject = RamFileManager.__checkProjectFolder( folderPath )
+        RamFileManager.__projectFolders[folderPath] = ( now, isProject )
+        return isProject
+
+    @staticmethod
+    def __checkProjectFolder( folderPath ):
+        """Lists the folder to check if it is the project root"""
         if not os.path.isdir( folderPath ):
             return False
 
@@ -140,15 +267,7 @@ class RamFileManager():
             if os.path.isfile(foundFile):
                 continue
             folderName = os.path.basename( foundFile )
-            if folderName in (
-                    '00-ADMIN',
-                    '01-PRE-PROD',
-                    '02-PROD',
-                    '03-POST-PROD',
-                    '04-ASSETS',
-                    '05-SHOTS',
-                    '06-EXPORT'
-                ):
+            if folderName in PROJECT_FOLDER_NAMES:
                 return True
 
         return False
@@ -252,6 +371,8 @@ class RamFileManager():
 
         # Check version
         versionInfo = RamFileManager.getLatestVersionInfo( filePath )
+        # The default "v" state is not shown in published names
+        hasState = versionInfo.state not in ("", "v", "V")
 
         # Generate Subfolder name
         versionFolder = ""
@@ -262,7 +383,7 @@ class RamFileManager():
         if (versionInfo.version <= 0): versionFolder = versionFolder + intToStr( 1 )
         else: versionFolder = versionFolder + intToStr( versionInfo.version )
         # State
-        if versionInfo.state != "" and versionInfo.state.lower() != "v":
+        if hasState:
             versionFolder = versionFolder + "_" + versionInfo.state
 
         # The complete path
@@ -271,8 +392,7 @@ class RamFileManager():
             versionFolder
         ))
         # make it if it does not exist yet
-        if not os.path.isdir( newFilePath ):
-            os.makedirs( newFilePath )
+        RamFileManager.ensureFolder( newFilePath )
 
         # add the fileName
         newFilePath = RamFileManager.buildPath ((
@@ -281,12 +401,14 @@ class RamFileManager():
         ))
 
         # store in a new info
-        publishedInfo = RamFileInfo()
-        publishedInfo.setFilePath( newFilePath )
+        # The published file has the same name in the same item and step:
+        # carry the info over instead of parsing the new path and its parent folders again
+        publishedInfo = fileInfo.copy( newFilePath )
+        publishedInfo.extension = fileInfo.extension.lstrip('.')
         # Reset the date, version, etc
         publishedInfo.date = fileInfo.date
         publishedInfo.version = versionInfo.version
-        if versionInfo.state != "" and versionInfo.state.lower() != "v":
+        if hasState:
             publishedInfo.state = versionInfo.state
 
         return publishedInfo
@@ -297,16 +419,17 @@ class RamFileManager():
         folder = RamFileManager.getPublishFolder( filePath )
 
         folders = []
-        for f in os.listdir(folder):
-            folderPath = RamFileManager.buildPath(( folder, f ))
-            if not os.path.isdir(folderPath): continue
-            folders.append( folderPath )
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_dir(): continue
+                folders.append( RamFileManager.buildPath(( folder, entry.name )) )
 
         return folders
 
     @staticmethod
-    def copyToVersion( filePath, increment = False, stateShortName="" ):
-        """Copies and increments a file into the version folder
+    def copyToVersion( filePath, increment = False, stateShortName="", metaData=None ):
+        """Copies and increments a file into the version folder.
+        metaData (dict) is set on the new version with its history date, in a single write
 
         Returns the filePath of the new file version"""
         from .metadata_manager import RamMetaDataManager
@@ -344,7 +467,7 @@ class RamFileManager():
 
         newFilePath = RamFileManager.buildPath(( versionsFolder, newFileName ))
         RamFileManager.copy( filePath, newFilePath )
-        RamMetaDataManager.appendHistoryDate( newFilePath )
+        RamMetaDataManager.appendHistoryDate( newFilePath, metaData )
         return newFilePath
 
     @staticmethod
@@ -352,61 +475,72 @@ class RamFileManager():
         """Gets the RamFileInfo for the latest version file"""
 
         latestVersionFilePath = RamFileManager.getLatestVersionFilePath( filePath, previous )
-        versionInfo = RamFileInfo()
-        versionInfo.setFilePath( latestVersionFilePath )
-        if versionInfo.state == '':
-            versionInfo.state = defaultStateShortName
-        return versionInfo
+        return RamFileManager._versionInfo( latestVersionFilePath, defaultStateShortName )
+
+    @staticmethod
+    def getLatestVersionInfos( filePath, defaultStateShortName="v" ):
+        """Gets the RamFileInfo for both the latest and the previous version files,
+        scanning the versions folder only once.
+
+        Returns a (latest, previous) tuple"""
+
+        latestVersionFilePath, prevVersionFilePath = RamFileManager.getLatestVersionFilePaths( filePath )
+        return (
+            RamFileManager._versionInfo( latestVersionFilePath, defaultStateShortName ),
+            RamFileManager._versionInfo( prevVersionFilePath, defaultStateShortName )
+        )
 
     @staticmethod
     def getLatestVersionFilePath( filePath, previous=False ):
         """Gets the file path of the latest version"""
+        latestVersionFilePath, prevVersionFilePath = RamFileManager.getLatestVersionFilePaths( filePath )
+        if previous:
+            return prevVersionFilePath
+        return latestVersionFilePath
+
+    @staticmethod
+    def getLatestVersionFilePaths( filePath ):
+        """Gets the file paths of the latest and the previous versions
+
+        Returns a (latest, previous) tuple"""
         # Check File Name
         fileName = os.path.basename( filePath )
         nm = RamFileInfo()
         if not nm.setFileName( fileName ):
             log( Log.MalformedName, LogLevel.Critical )
-            return ''
+            return ('', '')
 
         # Get versions
         versionsFolder = RamFileManager.getVersionFolder( filePath )
 
-        foundFiles = os.listdir( versionsFolder )
         highestVersion = 0
+        # The version files must match all these fields of the file
+        fileKey = RamFileManager._versionKey( nm )
 
         versionFilePath = ''
         prevVersionFilePath = ''
 
-        for foundFile in foundFiles:
-            if not os.path.isfile( versionsFolder + '/' + foundFile ): # This is in case the user has created folders in _versions
-                continue
-
-            foundNM = RamFileInfo()
-            if not foundNM.setFileName( foundFile ):
-                continue
-            if foundNM.project != nm.project:
-                continue
-            if foundNM.ramType != nm.ramType:
-                continue
-            if foundNM.shortName != nm.shortName:
-                continue
-            if foundNM.step != nm.step:
-                continue
-            if foundNM.resource != nm.resource:
-                continue
-            if foundNM.version == -1:
-                continue
+        # scandir entries know if they're files without another stat call
+        with os.scandir( versionsFolder ) as foundFiles:
+            for foundFile in foundFiles:
+                if not foundFile.is_file(): # This is in case the user has created folders in _versions
+                    continue
 
-            version = foundNM.version
-            if version > highestVersion:
-                highestVersion = version
-                prevVersionFilePath = versionFilePath
-                versionFilePath = versionsFolder + '/' + foundFile
+                foundNM = RamFileInfo()
+                if not foundNM.setFileName( foundFile.name ):
+                    continue
+                if RamFileManager._versionKey( foundNM ) != fileKey:
+                    continue
+                if foundNM.version == -1:
+                    continue
 
-        if previous:
-            return prevVersionFilePath
+                version = foundNM.version
+                if version > highestVersion:
+                    highestVersion = version
+                    prevVersionFilePath = versionFilePath
+                    versionFilePath = versionsFolder + '/' + foundFile.name
 
-        return versionFilePath
+        return (versionFilePath, prevVersionFilePath)
 
     @staticmethod
     def getVersionFilePaths( filePath ):
@@ -419,32 +553,26 @@ class RamFileManager():
         # Get versions
         versionsFolder = RamFileManager.getVersionFolder( filePath )
 
-        foundFiles = os.listdir( versionsFolder )
         versionFiles = []
+        # The version files must match all these fields of the file
+        fileKey = RamFileManager._versionKey( nm )
 
-        for foundFile in foundFiles:
-            foundFilePath = versionsFolder + '/' + foundFile
-            if not os.path.isfile( foundFilePath ): # This is in case the user has created folders in _versions
-                continue
-            
-            foundNM = RamFileInfo()
-            if not foundNM.setFileName( foundFile ):
-                continue
-            if foundNM.project != nm.project:
-                continue
-            if foundNM.ramType != nm.ramType:
-                continue
-            if foundNM.shortName != nm.shortName:
-                continue
-            if foundNM.step != nm.step:
-                continue
-            if foundNM.resource != nm.resource:
-                continue
+        with os.scandir( versionsFolder ) as foundFiles:
+            for foundFile in foundFiles:
+                if not foundFile.is_file(): # This is in case the user has created folders in _versions
+                    continue
+
+                foundNM = RamFileInfo()
+                if not foundNM.setFileName( foundFile.name ):
+                    continue
+                if RamFileManager._versionKey( foundNM ) != fileKey:
+                    continue
 
-            versionFiles.append( foundFilePath )
+                # Keep the version to sort the files without parsing their names again
+                versionFiles.append( ( foundNM.version, versionsFolder + '/' + foundFile.name ) )
 
-        versionFiles.sort( key = RamFileManager._versionFilesSorter )
-        return versionFiles
+        versionFiles.sort( key = RamFileManager._parsedVersionSorter )
+        return [ f for v, f in versionFiles ]
 
     @staticmethod
     def getVersionFolder( filePath ):
@@ -463,8 +591,7 @@ class RamFileManager():
         else:
             versionsFolder = fileFolder + '/' + versionsFolderName
 
-        if not os.path.isdir( versionsFolder ):
-            os.makedirs( versionsFolder )
+        RamFileManager.ensureFolder( versionsFolder )
 
         return versionsFolder
 
@@ -485,44 +612,42 @@ class RamFileManager():
         else:
             publishFolder = fileFolder + '/' + publishFolderName
 
-        if not os.path.isdir( publishFolder ):
-            os.makedirs( publishFolder )
+        RamFileManager.ensureFolder( publishFolder )
 
         return publishFolder
 
     @staticmethod
     def inPreviewFolder( path ):
         """Checks if the given path is inside a "preview" folder"""
-        currentFolder = os.path.dirname(path)
-        currentFolderName = os.path.basename( currentFolder )
-        return currentFolderName == settings.folderNames.preview
+        return RamFileManager._parentFolderName( path ) == settings.folderNames.preview
 
     @staticmethod
     def inPublishFolder( path ):
         """Checks if the given path is inside a "published" folder"""
-        currentFolder = os.path.dirname(path)
-        currentFolderName = os.path.basename( currentFolder )
-        if currentFolderName == settings.folderNames.publish: return True
-        currentFolder = os.path.dirname(currentFolder)
-        currentFolderName = os.path.basename( currentFolder )
-        return currentFolderName == settings.folderNames.publish
+        publishName = settings.folderNames.publish
+        # Most paths are not published at all: a single substring search rejects them
+        if publishName not in path:
+            return False
+        if os.altsep:
+            path = path.replace( os.altsep, os.sep )
+        # Split once to get both the parent and the grand-parent folder names
+        parts = path.rsplit( os.sep, 2 )
+        if len(parts) < 2:
+            return False
+        if len(parts) == 2:
+            return parts[0] == publishName
+        return parts[1] == publishName or parts[0].rpartition( os.sep )[2] == publishName
 
     @staticmethod
     def inVersionsFolder( path ):
         """Checks if the given path is inside a "versions" folder"""
-        currentFolder = os.path.dirname(path)
-        currentFolderName = os.path.basename( currentFolder )
-        return currentFolderName == settings.folderNames.versions
+        return RamFileManager._parentFolderName( path ) == settings.folderNames.versions
 
     @staticmethod
     def isReservedFolder( path ):
         """Checks if this is a reserved folder"""
         name = os.path.basename( path )
-        return name in [
-            FolderNames.versions,
-            FolderNames.publish,
-            FolderNames.preview
-        ]
+        return name in RESERVED_FOLDER_NAMES
 
     @staticmethod
     def inReservedFolder( path ):
@@ -541,16 +666,14 @@ class RamFileManager():
         if name == "":
             return True
 
-        regex = re.compile('^[ a-zA-Z0-9+-]{1,256}$', re.IGNORECASE)
-        if re.match(regex, name):
+        if RE_NAME.match(name):
             return True
         return False
 
     @staticmethod
     def validateShortName( name ):
         """Checks if the name is valid, respects the Ramses naming scheme"""
-        regex = re.compile('^[a-z0-9+-]{1,10}$', re.IGNORECASE)
-        if re.match(regex, name):
+        if RE_SHORT_NAME.match(name):
             return True
         return False
 
@@ -559,6 +682,16 @@ class RamFileManager():
         """Builds a path with a list of folder names or subpaths,
         adding the '/' only if needed, and ignoring empty blocks"""
 
+        # Most calls join a folder and a file name, often in loops:
+        # do it with a single concatenation
+        if len(folders) == 2:
+            folder, name = folders
+            if folder == '':
+                return name
+            if name == '' or folder.endswith('/'):
+                return folder + name
+            return folder + '/' + name
+
         fullPath = ''
 
         for folder in folders:
@@ -580,7 +713,7 @@ class RamFileManager():
 
         Returns: bool
         """
-        if re.match( '^([a-z0-9+-]{1,10})_([ASG])_([a-z0-9+-]{1,10})$', n , re.IGNORECASE): return True
+        if RE_ITEM_FOLDER_NAME.match( n ): return True
         return False
 
     @staticmethod
@@ -589,38 +722,40 @@ class RamFileManager():
 
         Returns: str
         """
-        forbiddenCharacters = {
-            '"' : ' ',
-            '_' : '-',
-            '[' : '-',
-            ']' : '-',
-            '{' : '-',
-            '}' : '-',
-            '(' : '-',
-            ')' : '-',
-            '\'': ' ',
-            '`' : ' ',
-            '.' : '-',
-            '/' : '-',
-            '\\' : '-',
-            ',' : ' ' 
-            }
+        return resourceStr.translate( RESOURCE_TRANSLATION )
 
-        fixedResourceStr = ''
-        for char in resourceStr:
-            if char in forbiddenCharacters:
-                fixedResourceStr = fixedResourceStr + forbiddenCharacters[char]
-            else:
-                fixedResourceStr = fixedResourceStr + char
-        return fixedResourceStr
+    @staticmethod
+    def _versionInfo( versionFilePath, defaultStateShortName ):
+        """Low-level, undocumented. Builds the RamFileInfo of a version file.
+
+        Returns: RamFileInfo
+        """
+        versionInfo = RamFileInfo()
+        versionInfo.setFilePath( versionFilePath )
+        if versionInfo.state == '':
+            versionInfo.state = defaultStateShortName
+        return versionInfo
 
     @staticmethod
-    def _versionFilesSorter( f ):
-        fileName = os.path.basename(f)
-        nm = RamFileInfo()
-        if not nm.setFileName( fileName ):
-            return -1
-        return nm.version
+    def _parentFolderName( path, level=1 ):
+        """Returns the name of the folder containing the path (level 1), or of its parents.
+        Equivalent to chained os.path.dirname/basename calls, with a single string split"""
+        if os.altsep:
+            path = path.replace( os.altsep, os.sep )
+        parts = path.rsplit( os.sep, level )
+        if len(parts) <= level:
+            return ''
+        return parts[0].rpartition( os.sep )[2]
+
+    @staticmethod
+    def _versionKey( nm ):
+        """The fields a version file shares with its working file"""
+        return ( nm.project, nm.ramType, nm.shortName, nm.step, nm.resource )
+
+    @staticmethod
+    def _parsedVersionSorter( versionFile ):
+        """Sorts (version, filePath) tuples by version, the version being parsed when listing the files"""
+        return versionFile[0]
 
     @staticmethod
     def _publishVersionFoldersSorter( f ):
@@ -629,22 +764,23 @@ class RamFileManager():
         numBlocks = len(folderNameList)
         # Invalid, return the lowest value
         if numBlocks == 0 or numBlocks > 3:
-            return float('-inf')
+            return LOWEST_VERSION
         # Single or dual block, should be a number
         if numBlocks == 1 or numBlocks == 2:
             # naming could be faulty
             try:
                 n = int(folderNameList[0])
             except ValueError:
-                n = float('-inf')
+                n = LOWEST_VERSION
             return n
         # Triple block, there's a resource, we return the version
         # -resourceId + version
         resourceBytes = folderNameList[0].encode('utf_8', 'replace')
-        resourceInt = - int( codecs.encode( resourceBytes, 'hex' ), 16 ) * 1000
+        # Same value as parsing the hex string of the bytes
+        resourceInt = - int.from_bytes( resourceBytes, 'big' ) * 1000
         # naming could be faulty
         try:
             n = int(folderNameList[1])
         except ValueError:
-            n = float('-inf')
+            n = LOWEST_VERSION
         return resourceInt + n
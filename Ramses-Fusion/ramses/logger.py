@@ -17,19 +17,26 @@
 #
 #======================= END GPL LICENSE BLOCK ========================
 
-from datetime import datetime
 import linecache
 import sys
 from .constants import LogLevel
 
+# The RamSettings instance, bound on the first call to log()
+# (the settings import the logger, it can't be imported here)
+_settings = None
+
 def log( message, level = LogLevel.Info ):
-    from .ram_settings import RamSettings
+    global _settings
+    if _settings is None:
+        from .ram_settings import RamSettings
+        _settings = RamSettings.instance()
+
+    minLevel = _settings.logLevel
+    if (level < minLevel ): return
 
+    # Convert only the messages which are actually printed
     message = str(message)
 
-    minLevel = RamSettings.instance().logLevel
-    if (level < minLevel ): return
-    
     if level == LogLevel.DataReceived:
         message = "Ramses has just recieved some data: " + message
     elif level == LogLevel.DataSent:
@@ -43,9 +50,6 @@ def log( message, level = LogLevel.Info ):
     elif level == LogLevel.Fatal:
         message = "/!\\ Fatal error, Ramses last words are: " + message
 
-    now = datetime.now()
-
-    #print( "[" + now.strftime("%Y/%m/%d - %H:%M:%s") + "] " + message )
     print( message )
 
 def printException():
@@ -30,15 +30,28 @@ class RamMetaDataManager():
     thus the metadata used by Ramses is set on a per-folder basis, and is not copied when a file is copied/moved:
     it does not make sens for Ramses to have the same metadata when a file is moved."""
 
+    # Cache stuff
+    # Metadata already read or written, as json text: { metaDataFile: (time, content, stamps) }
+    __metaData = {}
+
     @staticmethod
-    def appendHistoryDate(filePath):
-        """Sets a new entry in the modification history"""
-        history = RamMetaDataManager.getValue(filePath, MetaDataKeys.MODIFICATION_HISTORY)
-        if history is None:
-            history = []
+    def appendHistoryDate(filePath, values=None):
+        """Sets a new entry in the modification history.
+        Other values (a dict) can be set in the same write"""
+        # Read and write the metadata file only once,
+        # instead of getValue() then setValue() which read it twice
+        folderPath, fileName = os.path.split(filePath)
+        # Always start from the file on disk: other processes (the Ramses Client, other workstations) write it too
+        data = RamMetaDataManager.getMetaData( folderPath, False )
+        fileData = data.get(fileName, {})
+        history = fileData.get(MetaDataKeys.MODIFICATION_HISTORY, [])
         timeStamp = time.mktime( datetime.now().timetuple() )
         history.append( int(timeStamp) )
-        RamMetaDataManager.setValue(filePath, MetaDataKeys.MODIFICATION_HISTORY, history)
+        fileData[MetaDataKeys.MODIFICATION_HISTORY] = history
+        if values:
+            fileData.update(values)
+        data[fileName] = fileData
+        RamMetaDataManager.setMetaData( folderPath, data )
 
     @staticmethod
     def getValue(filePath, key):
@@ -73,12 +86,23 @@ class RamMetaDataManager():
     @staticmethod
     def setValue(filePath, key, value):
         """Sets a value for a specific key for the file"""
-        # file data
-        fileData = RamMetaDataManager.getFileMetaData(filePath)
-        # update comment
-        fileData[key] = value
-        # re-set file data
-        RamMetaDataManager.setFileMetaData( filePath, fileData )
+        RamMetaDataManager.setValues(filePath, { key: value })
+
+    @staticmethod
+    def setValues(filePath, values):
+        """Sets the values of several keys for the file at once,
+        reading and writing the metadata file only once"""
+        folderPath, fileName = os.path.split(filePath)
+        # Always start from the file on disk: other processes (the Ramses Client, other workstations) write it too
+        data = RamMetaDataManager.getMetaData( folderPath, False )
+        # update file data
+        fileData = data.get(fileName, {})
+        # The values are already set: no need to write the file
+        if all( key in fileData and fileData[key] == value for key, value in values.items() ):
+            return
+        fileData.update(values)
+        data[fileName] = fileData
+        RamMetaDataManager.setMetaData( folderPath, data )
 
     @staticmethod
     def getVersionFilePath( filePath ):
@@ -146,10 +170,11 @@ class RamMetaDataManager():
         """Gets the metadata .json file for the given path"""
         folder = path
         # if it's a file or if it does not exist (yet, it may be a file being created, due to threading, it may not be available yet)
-        if os.path.isfile(folder) or not os.path.exists(folder):
-            folder = os.path.dirname(folder)
+        # A single isdir() check covers both cases
         if not os.path.isdir(folder):
-            raise ValueError("The given path does not exist: " + folder)
+            folder = os.path.dirname(folder)
+            if not os.path.isdir(folder):
+                raise ValueError("The given path does not exist: " + folder)
                 
         return RamFileManager.buildPath((
             folder,
@@ -166,41 +191,75 @@ class RamMetaDataManager():
         return {}
 
     @staticmethod
-    def getMetaData( folderPath ):
-        """removes metadata for files which don't exist anymore and returns the data"""
+    def getMetaData( folderPath, useCache=True ):
+        """removes metadata for files which don't exist anymore and returns the data.
+        Set useCache to False to read the file again before modifying and writing the data."""
         file = RamMetaDataManager.getMetaDataFile( folderPath )
-        if not os.path.exists( file ):
-            return {}
 
+        # The same folder metadata is read several times when saving or publishing:
+        # keep it for 2 seconds, like the object data.
+        # The json text is kept, not the dict: parsing it again is faster than copying the dict,
+        # and the callers get their own data which they may modify
+        cached = None
+        if useCache:
+            cached = RamMetaDataManager.__metaData.get( file )
+        if cached is not None and time.time() - cached[0] < 2:
+            return json.loads( cached[1] )
+
+        # After that, if neither the metadata file nor the folder content has changed,
+        # two stat calls are enough to know the data is still valid.
+        # Writes never get here: they always read the file again
+        stamps = RamMetaDataManager.__stamps( file )
+        if cached is not None and stamps is not None and stamps == cached[2]:
+            RamMetaDataManager.__metaData[file] = ( time.time(), cached[1], stamps )
+            return json.loads( cached[1] )
+
+        # Just try to read it: checking if it exists first would stat the file twice
         data = {}
-        with open(file, 'r') as f:
-            content = f.read()
-            try:
-                data = json.loads(content)
-            except:
-                return {}
-
-        folder = folderPath
-        if os.path.isfile(folderPath):
-            folder = os.path.dirname(folderPath)
-        
-        for fileName in dict(data):
-            test = RamFileManager.buildPath((
-                folder,
-                fileName
-            ))
-            if not os.path.isfile(test):
-                del data[fileName]
-        
+        try:
+            with open(file, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return {}
+        try:
+            data = json.loads(content)
+        except:
+            return {}
+
+        # Same folder as the one found by getMetaDataFile
+        folder = os.path.dirname( file )
         
+        # List the folder once instead of checking each file
+        with os.scandir(folder) as it:
+            existingFiles = { entry.name for entry in it if entry.is_file() }
+
+        missingFiles = [ fileName for fileName in data if not fileName in existingFiles ]
+        for fileName in missingFiles:
+            del data[fileName]
+        # Keep the text of the data actually returned
+        if missingFiles:
+            content = json.dumps( data )
+
+        RamMetaDataManager.__metaData[file] = ( time.time(), content, stamps )
         return data
 
+    @staticmethod
+    def __stamps( file ):
+        """The modification time and size of the metadata file and the modification time of its folder,
+        or None if they're not available.
+        The size catches some changes the modification time misses on file systems with a coarse resolution (SMB, FAT)"""
+        try:
+            fileStat = os.stat( file )
+            return ( fileStat.st_mtime_ns, fileStat.st_size, os.stat( os.path.dirname( file ) ).st_mtime_ns )
+        except OSError:
+            return None
+
     @staticmethod
     def setFileMetaData(filePath, fileData):
         """Sets the metadata for the given file using the given dict"""
-        folderPath = os.path.dirname(filePath)
-        fileName = os.path.basename(filePath)
-        data = RamMetaDataManager.getMetaData( folderPath )
+        folderPath, fileName = os.path.split(filePath)
+        # Always start from the file on disk: other processes (the Ramses Client, other workstations) write it too
+        data = RamMetaDataManager.getMetaData( folderPath, False )
         data[fileName] = fileData
         RamMetaDataManager.setMetaData( folderPath, data )
 
@@ -209,5 +268,10 @@ class RamMetaDataManager():
         """Sets the metadata for the given path using the given dict"""
         file = RamMetaDataManager.getMetaDataFile( path )
 
+        # Serialize first and write once: json.dump() would write
+        # each small chunk produced by the encoder separately
+        content = json.dumps( data, indent = 4 )
         with open(file, 'w') as f:
-            json.dump( data, f, indent = 4)
+            f.write( content )
+
+        RamMetaDataManager.__metaData[file] = ( time.time(), content, RamMetaDataManager.__stamps( file ) )
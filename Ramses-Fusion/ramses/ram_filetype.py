@@ -46,12 +46,13 @@ class RamFileType( RamObject ):
     def check(self, filePath):
         """Checks if the given file is of this type"""
 
-        fileBlocks = filePath.split('.')
+        # Only the part after the last dot is needed, don't split the whole path
+        head, dot, extension = filePath.rpartition('.')
 
-        if len(fileBlocks) < 2:
+        if dot == '':
             return False
 
-        if fileBlocks[-1] in self.extensions():
+        if extension in self.extensions():
             return True
 
         return False
\ No newline at end of file
@@ -17,12 +17,10 @@
 #
 #======================= END GPL LICENSE BLOCK ========================
 
-import os
-from platform import version
+import os, time
 from .file_info import RamFileInfo
 from .ram_object import RamObject
 from .file_manager import RamFileManager
-from .file_info import RamFileInfo
 from .daemon_interface import RamDaemonInterface
 from .logger import log
 from .constants import Log, LogLevel, ItemType, FolderNames
@@ -37,13 +35,14 @@ class RamItem( RamObject ):
     """
 
     @staticmethod
-    def fromPath( fileOrFolderPath, virtualIfNotFound = False ):
+    def fromPath( fileOrFolderPath, virtualIfNotFound = False, fileInfo = None ):
         """Returns a RamAsset or RamShot instance built using the given path.
         The path can be any file or folder path from the asset 
         (a version file, a preview file, etc)
 
         Args:
             path (str)
+            fileInfo (RamFileInfo, optional): the info already parsed from this path, to not parse it again
 
         Returns:
             RamAsset or RamShot
@@ -55,8 +54,10 @@ class RamItem( RamObject ):
 
         RAMSES = Ramses.instance()
 
-        nm = RamFileInfo()
-        nm.setFilePath( fileOrFolderPath )
+        nm = fileInfo
+        if nm is None:
+            nm = RamFileInfo()
+            nm.setFilePath( fileOrFolderPath )
 
         if nm.ramType == ItemType.ASSET:
             uuid = DAEMON.uuidFromPath( fileOrFolderPath, "RamAsset" )
@@ -107,6 +108,11 @@ class RamItem( RamObject ):
             uuid (str)
         """
         super(RamItem, self).__init__( uuid, data, create, objectType )
+        # The project can't change, keep it once found
+        self.__project = None
+        # The data of the group (sequence or asset group), cached like the data
+        self.__groupDataCache = {}
+        self.__groupDataTime = 0
         if objectType == "RamShot":
             self.__itemType = ItemType.SHOT
         elif objectType == "RamAsset":
@@ -155,11 +161,14 @@ class RamItem( RamObject ):
 
     def latestPublishedVersionFolderPath( self, step="", fileName='', resource=None ):
         """Gets the latest published version folder for the given fileName. Returns the latest folder if the fileName is omitted or an empty string"""
+        # Not cached: the folder has to be found right after a publish
         versionFolders = self.publishedVersionFolderPaths(step, fileName, resource)
-        
-        if len(versionFolders) == 0:
-            return ''
-        return versionFolders[-1]
+
+        latestFolder = ''
+        if len(versionFolders) > 0:
+            latestFolder = versionFolders[-1]
+
+        return latestFolder
 
     def latestVersion( self, resource="", state="", step=""):
         """Returns the highest version number for the given state (wip, pub…) (or all states if empty string).
@@ -182,9 +191,12 @@ class RamItem( RamObject ):
         if versionFolder == '':
             return highestVersion
 
+        # Reuse a single info and bind its parser out of the loop
+        nm = RamFileInfo()
+        setFileName = nm.setFileName
+
         for file in os.listdir( versionFolder ):
-            nm = RamFileInfo()
-            if not nm.setFileName( file ):
+            if not setFileName( file ):
                 continue
             if nm.step != step and step != '':
                 continue
@@ -216,9 +228,12 @@ class RamItem( RamObject ):
         versionFile = ''
         highestVersion = -1
 
+        # Reuse a single info and bind its parser out of the loop
+        nm = RamFileInfo()
+        setFileName = nm.setFileName
+
         for file in os.listdir( versionFolderPath ):
-            nm = RamFileInfo()
-            if not nm.setFileName( file ):
+            if not setFileName( file ):
                 continue
             if nm.step != step and step != '':
                 continue
@@ -254,8 +269,7 @@ class RamItem( RamObject ):
             FolderNames.preview
             ))
 
-        if not os.path.isdir(previewFolder):
-            os.makedirs(previewFolder)
+        RamFileManager.ensureFolder( previewFolder )
 
         return previewFolder
 
@@ -278,20 +292,16 @@ class RamItem( RamObject ):
         """Returns the project this item belongs to"""
         from .ram_project import RamProject
 
-        groupData = {}
-
-        if self.__itemType == ItemType.SHOT:
-            seqUuid = self.get("sequence", "")
-            if seqUuid:
-                groupData = DAEMON.getData( seqUuid )
+        if self.__project is not None:
+            return self.__project
 
-        elif self.__itemType == ItemType.ASSET:
-            agUuid = self.get("assetGroup", "")
-            if agUuid:
-                groupData = DAEMON.getData( agUuid )
+        groupData = self.__groupData()
 
         projUuid = groupData.get("project", "")
-        return RamProject(projUuid)
+        project = RamProject(projUuid)
+        if projUuid != "":
+            self.__project = project
+        return project
 
     def projectShortName(self):
         """Returns the short name of the project this item belongs to"""
@@ -323,8 +333,7 @@ class RamItem( RamObject ):
             FolderNames.publish
             ))
 
-        if not os.path.isdir(publishFolder):
-            os.makedirs(publishFolder)
+        RamFileManager.ensureFolder( publishFolder )
 
         return publishFolder
 
@@ -342,24 +351,24 @@ class RamItem( RamObject ):
 
         publishFolderPath = self.publishFolderPath(step)
 
+        # Keep the folder names with the paths, no need to extract them again
+        # scandir entries know if they're folders without another stat call
         versionFolders = []
-        for f in os.listdir(publishFolderPath):
-            folderPath = RamFileManager.buildPath(( publishFolderPath, f ))
-            if not os.path.isdir(folderPath): continue
-            versionFolders.append( folderPath )
-
-        versionFolders.sort(key=RamFileManager._publishVersionFoldersSorter)
+        with os.scandir(publishFolderPath) as entries:
+            for entry in entries:
+                if not entry.is_dir(): continue
+                versionFolders.append( (entry.name, RamFileManager.buildPath(( publishFolderPath, entry.name ))) )
 
-        if len(versionFolders) == 0: return versionFolders
+        versionFolders.sort(key=lambda folder: RamFileManager._publishVersionFoldersSorter(folder[0]))
 
-        if fileName == '' and resource is None: return versionFolders
+        if fileName == '' and resource is None: return [ folder for f, folder in versionFolders ]
 
         publishedFolders = []
         #filter by filename and resource
-        for folder in versionFolders:
+        for f, folder in versionFolders:
             # Check the resource
             if resource is not None:
-                folderName = os.path.basename( folder ).split('_')
+                folderName = f.split('_')
                 if len(folderName) != 3 and resource != '': continue
                 elif len(folderName) == 3 and resource != folderName[0]: continue
 
@@ -367,8 +376,9 @@ class RamItem( RamObject ):
                 publishedFolders.append(folder)
                 continue
 
-            for f in os.listdir(folder):
-                if f == fileName: publishedFolders.append(folder)
+            # No need to list the folder to know if it contains the file
+            if os.path.exists( RamFileManager.buildPath(( folder, fileName )) ):
+                publishedFolders.append(folder)
 
         return publishedFolders
 
@@ -415,13 +425,16 @@ class RamItem( RamObject ):
             return []
 
         files = []
+        # Read these once, not for each file
+        shortName = self.shortName()
+        itemType = self.itemType()
 
         for file in os.listdir(stepFolder):
             # check file
             nm = RamFileInfo()
             if not nm.setFileName( file ):
                 continue
-            if nm.project != pShortName or nm.step != step or nm.shortName != self.shortName() or nm.ramType != self.itemType():
+            if nm.project != pShortName or nm.step != step or nm.shortName != shortName or nm.ramType != itemType:
                 continue
             files.append(RamFileManager.buildPath((
                 stepFolder,
@@ -457,8 +470,7 @@ class RamItem( RamObject ):
             stepFolderName
         ))
 
-        if not os.path.isdir(stepFolderPath):
-            os.makedirs( stepFolderPath )
+        RamFileManager.ensureFolder( stepFolderPath )
 
         return stepFolderPath
 
@@ -478,29 +490,34 @@ class RamItem( RamObject ):
 
         files = []
 
+        # These don't change while checking the files
+        itemType = self.itemType()
+        shortName = self.shortName()
+        # setFileName() resets the info, a single instance can be reused
+        nm = RamFileInfo()
+
         for file in os.listdir( versionFolderPath ):
-            nm = RamFileInfo()
             if not nm.setFileName( file ):
                 continue
             if nm.project != pShortName:
                 continue
-            itemType = self.itemType()
             if nm.ramType != itemType:
                 continue
             if itemType == ItemType.GENERAL:
-                if self.shortName() != nm.shortName:
+                if shortName != nm.shortName:
                     continue
             else:
-                if nm.step != step or nm.shortName != self.shortName():
+                if nm.step != step or nm.shortName != shortName:
                     continue
             if nm.resource == resource:
-                files.append(RamFileManager.buildPath((
+                # Keep the version to sort the files without parsing their names again
+                files.append(( nm.version, RamFileManager.buildPath((
                     versionFolderPath,
                     file
-                )))
+                ))))
 
-        files.sort( key = RamFileManager._versionFilesSorter )
-        return files
+        files.sort( key = RamFileManager._parsedVersionSorter )
+        return [ f for v, f in files ]
 
     def versionFolderPath( self, step="" ): 
         """Path to the version folder relative to the item root folder
@@ -522,8 +539,7 @@ class RamItem( RamObject ):
             FolderNames.versions
             ))
 
-        if not os.path.isdir(versionFolder):
-            os.makedirs( versionFolder )
+        RamFileManager.ensureFolder( versionFolder )
         
         return versionFolder
 
@@ -535,6 +551,15 @@ class RamItem( RamObject ):
             str
         """
 
+        return self.__groupData().get("name", "")
+
+    def __groupData( self ):
+        """Gets the data of the sequence or asset group containing this item.
+        Kept for 2 seconds like the object data, as both the project and the group are read from it"""
+
+        if self.__groupDataCache and time.time() - self.__groupDataTime < 2:
+            return self.__groupDataCache
+
         groupData = {}
 
         if self.__itemType == ItemType.SHOT:
@@ -547,4 +572,6 @@ class RamItem( RamObject ):
             if agUuid != "":
                 groupData = DAEMON.getData( agUuid )
 
-        return groupData.get("name", "")
\ No newline at end of file
+        self.__groupDataCache = groupData
+        self.__groupDataTime = time.time()
+        return groupData
\ No newline at end of file
@@ -85,6 +85,10 @@ class RamObject(object):
             self.__data = {}
             self.__cacheTime = 0
 
+        # The folder path, cached like the data
+        self.__folderPath = ""
+        self.__folderPathTime = 0
+
         if create:
             reply = DAEMON.create( self.__uuid, self.__data, objectType )
             if not DAEMON.checkReply(reply):
@@ -94,8 +98,9 @@ class RamObject(object):
         """Returns the uuid of the object"""
         return self.__uuid
 
-    def data( self ):
-        """Gets the data for this object"""
+    def data( self, useCache=True ):
+        """Gets the data for this object.
+        Set useCache to False to get the data from the daemon even if it was just read"""
         if self.__virtual:
             return self.__data
 
@@ -103,7 +108,7 @@ class RamObject(object):
         # there's a 2-second timeout to not post too many queries
         # and improve performance
         cacheElapsed = time.time() - self.__cacheTime
-        if self.__data and cacheElapsed < 2:
+        if useCache and self.__data and cacheElapsed < 2:
             return self.__data
 
         # Get the data from the daemon
@@ -133,10 +138,35 @@ class RamObject(object):
 
     def set(self, key, value):
         """Sets a new value in the object data"""
+        # Only post to the daemon when the value actually changes
+        if self._hasValues({ key: value }):
+            return
         data = self.data()
         data[key] = value
         self.setData(data)
 
+    def setValues(self, values):
+        """Sets several values (a dict) in the object data at once,
+        sending the data to the daemon only once"""
+        # Only post to the daemon when a value actually changes
+        if self._hasValues(values):
+            return
+        data = self.data()
+        data.update(values)
+        self.setData(data)
+
+    def _hasValues(self, values):
+        """Checks if the object data already contains all the given values (a dict)"""
+        def hasValues( data ):
+            return all( key in data and data[key] == value for key, value in values.items() )
+
+        # A different value in the cached data is enough to know the data has to be written
+        if not hasValues( self.data() ):
+            return False
+        # But the cached data may be up to 2 seconds old: another client may have
+        # changed the values since. Check the current data before skipping the write
+        return hasValues( self.data( False ) )
+
     def name( self ):
         """
         Returns:
@@ -179,12 +209,19 @@ class RamObject(object):
         """Returns the folder corresponding to this object"""
         if self.__virtual:
             return self.get("folderPath", "")
+        # Same 2-second timeout as the data: the path is needed
+        # several times when building step, version or publish paths
+        if self.__folderPath and time.time() - self.__folderPathTime < 2:
+            return self.__folderPath
+
         p = DAEMON.getPath( self.__uuid )
         if p != "" and not os.path.isdir( p ):
             try:
                 os.makedirs( p )
             except:
                 return ""
+        self.__folderPath = p
+        self.__folderPathTime = time.time()
         return p
 
     def virtual( self ):
@@ -193,9 +230,10 @@ class RamObject(object):
 
     def __str__( self ):
         n = self.shortName()
-        if self.name() != '':
+        name = self.name()
+        if name != '':
             if n != '': n = n + " | "
-            n = n + self.name()
+            n = n + name
         return n
 
     def __eq__(self, other):
@@ -71,9 +71,7 @@ class RamPipe( RamObject ):
         if not pipeFileListUuid:
             return pipeFiles
         for uuid in pipeFileListUuid:
-            p = RamPipeFile( uuid )
-            if p:
-                pipeFiles.append(p)
+            pipeFiles.append( RamPipeFile( uuid ) )
         return pipeFiles
 
     def __str__( self ):
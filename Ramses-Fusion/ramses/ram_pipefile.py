@@ -23,6 +23,7 @@ from .file_manager import RamFileManager
 from .ram_object import RamObject
 from .ram_filetype import RamFileType
 from .metadata_manager import RamMetaDataManager
+from .constants import MetaDataKeys
 
 class RamPipeFile( RamObject ):
     """A file which goes through a RamPipe."""
@@ -48,19 +49,26 @@ class RamPipeFile( RamObject ):
         Note that the filename must end with the pipe shortname (it must be at the end of its resource)"""
 
         # It must be of the correct type
-        if not self.fileType().check( filePath ) and checkFileType:
+        if checkFileType and not self.fileType().check( filePath ):
             return False
 
-        # Have the type in the metadata
         pipeType = RamMetaDataManager.getPipeType( filePath )
-        if pipeType == self.shortName():
+        return RamPipeFile.__checkPipeType( filePath, pipeType, self.shortName() )
+
+    @staticmethod
+    def __checkPipeType( filePath, pipeType, shortName ):
+        """Checks the pipe type found in the metadata, or the resource of the file"""
+
+        # Have the type in the metadata
+        if pipeType == shortName:
             return True
         elif pipeType != '':
             return False
 
         # Or have the short name in the resource
-        fileBlocks = filePath.split('.')[-2]
-        if not fileBlocks.endswith(self.shortName()):
+        # (the block before the extension: split only from the end, not the whole path)
+        fileBlocks = filePath.rsplit('.', 2)[-2]
+        if not fileBlocks.endswith(shortName):
             return False
         return True
 
@@ -72,12 +80,18 @@ class RamPipeFile( RamObject ):
 
         files = []
 
+        # Read the folder metadata and the short name once, not for each file
+        metaData = RamMetaDataManager.getMetaData( folderPath )
+        shortName = self.shortName()
+
         for file in os.listdir(folderPath):
             filePath = RamFileManager.buildPath((
                 folderPath,
                 file
             ))
-            if self.check( filePath ):
+            pipeType = metaData.get( file, {} ).get( MetaDataKeys.PIPE_TYPE )
+            if pipeType is None: pipeType = ''
+            if RamPipeFile.__checkPipeType( filePath, pipeType, shortName ):
                 files.append( filePath )
 
         return files
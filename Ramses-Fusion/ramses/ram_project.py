@@ -18,11 +18,11 @@
 #======================= END GPL LICENSE BLOCK ========================
 
 import os
+import time
 from .file_info import RamFileInfo
 from .daemon_interface import RamDaemonInterface
 from .file_manager import RamFileManager
 from .logger import log
-from .utils import removeDuplicateObjectsFromList
 from .ram_settings import RamSettings
 from .ram_object import RamObject
 from .ram_asset import RamAsset
@@ -34,6 +34,10 @@ SETTINGS = RamSettings.instance()
 class RamProject( RamObject ):
     """A project handled by Ramses. Projects contains general items, assets and shots."""
 
+    # Cache stuff
+    # Steps already found by short name, for all projects: { (projectUuid, shortName): (time, RamStep) }
+    __steps = {}
+
     @staticmethod
     def fromPath( path ):
         """Creates a project object from any path, trying to get info from the given path"""
@@ -302,10 +306,19 @@ class RamProject( RamObject ):
         return:
             RamStep
         """
+        # Each step of the list needs its own query to get its short name:
+        # keep the steps found for 2 seconds, like the object data
+        key = ( self.uuid(), shortName )
+        cached = RamProject.__steps.get( key )
+        if cached is not None and time.time() - cached[0] < 2:
+            return cached[1]
+
         stps = self.steps()
         for s in stps:
             if s.shortName() == shortName:
+                RamProject.__steps[key] = ( time.time(), s )
                 return s
+        RamProject.__steps.pop( key, None )
         return None
 
     def steps( self, stepType=StepType.ALL ):
@@ -334,18 +347,29 @@ class RamProject( RamObject ):
     def _getAssetsInFolder(self, folderPath, assetGroup=None ):
         """lists and returns all assets in the given folder"""
         assetList = []
-        
-        for foundFile in os.listdir( folderPath ):
-            # look in subfolder
-            if os.path.isdir( folderPath + '/' + foundFile ):
-                assets = self._getAssetsInFolder( folderPath + '/' + foundFile, assetGroup )
-                assetList = assetList + assets
-            
-            # Get Asset
-            asset = RamAsset.fromPath( folderPath + '/' + foundFile )
-            if asset is None:
-                continue
-            if asset.group() == assetGroup:
-                assetList.append( asset )
-
-        return removeDuplicateObjectsFromList( assetList )
+        # All the files of an asset give the same asset:
+        # check the group of each asset only once
+        assetUuids = set()
+
+        # Walk the subfolders with a stack instead of recursing
+        folders = [ folderPath ]
+        while folders:
+            currentFolder = folders.pop()
+            for foundFile in os.listdir( currentFolder ):
+                foundPath = currentFolder + '/' + foundFile
+                # look in subfolder
+                if os.path.isdir( foundPath ):
+                    folders.append( foundPath )
+
+                # Get Asset
+                asset = RamAsset.fromPath( foundPath )
+                if asset is None:
+                    continue
+                uuid = asset.uuid()
+                if uuid in assetUuids:
+                    continue
+                assetUuids.add( uuid )
+                if asset.group() == assetGroup:
+                    assetList.append( asset )
+
+        return assetList
@@ -25,6 +25,18 @@ from .logger import log
 
 theVersion = "0.10.0-Beta"
 
+# The keys of the settings file and the corresponding RamSettings attributes
+SETTINGS_KEYS = (
+    ('clientPath', 'ramsesClientPath'),
+    ('clientPort', 'ramsesClientPort'),
+    ('logLevel', 'logLevel'),
+    ('autoIncrementTimeout', 'autoIncrementTimeout'),
+    ('userSettings', 'userSettings'),
+    ('debugMode', 'debugMode'),
+    ('userScripts', 'userScripts'),
+    ('recentFiles', 'recentFiles'),
+)
+
 class RamSettings( object ):
     """Gets and saves settings used by Ramses.
 
@@ -93,27 +105,21 @@ class RamSettings( object ):
                 cls._folderPath = ''
                 cls._filePath = ''
 
-            # Get settings from file
-            if os.path.isfile( cls._filePath ):
+            # The settings as last read from or written to the file
+            cls._savedSettings = ""
+
+            # Get settings from file, if there's one
+            try:
                 with open(cls._filePath, 'r', encoding="utf8") as settingsFile:
                     settingsStr = settingsFile.read()
-                    settingsDict = json.loads( settingsStr )
-                    if 'clientPath' in settingsDict:
-                        cls.ramsesClientPath = settingsDict['clientPath']
-                    if 'clientPort' in settingsDict:
-                        cls.ramsesClientPort = settingsDict['clientPort']
-                    if 'logLevel' in settingsDict:
-                        cls.logLevel = settingsDict['logLevel']
-                    if 'autoIncrementTimeout' in settingsDict:
-                        cls.autoIncrementTimeout = settingsDict['autoIncrementTimeout']
-                    if 'debugMode' in settingsDict:
-                        cls.debugMode = settingsDict['debugMode']
-                    if 'userSettings' in settingsDict:
-                        cls.userSettings = settingsDict['userSettings']
-                    if 'userScripts' in settingsDict:
-                        cls.userScripts = settingsDict['userScripts']
-                    if 'recentFiles' in settingsDict:
-                        cls.recentFiles = settingsDict['recentFiles']
+            except OSError:
+                settingsStr = ""
+            if settingsStr != "":
+                cls._savedSettings = settingsStr
+                settingsDict = json.loads( settingsStr )
+                for key, attribute in SETTINGS_KEYS:
+                    if key in settingsDict:
+                        setattr( cls, attribute, settingsDict[key] )
 
         return cls._instance
 
@@ -129,21 +135,19 @@ class RamSettings( object ):
 
         log("I'm saving your settings...")
 
-        settingsDict = {
-            'clientPath': self.ramsesClientPath,
-            'clientPort': self.ramsesClientPort,
-            'logLevel': self.logLevel,
-            'autoIncrementTimeout': self.autoIncrementTimeout,
-            'userSettings': self.userSettings,
-            'debugMode': self.debugMode,
-            'userScripts': self.userScripts,
-            'recentFiles': self.recentFiles
-        }
+        settingsDict = { key: getattr( self, attribute ) for key, attribute in SETTINGS_KEYS }
 
         if self._filePath == '':
             raise ("Invalid path for the settings, I can't save them, sorry.")
 
+        settingsStr = json.dumps( settingsDict, indent=4 )
+        # Nothing changed since the file was read or written
+        if settingsStr == RamSettings._savedSettings:
+            log("Settings saved!")
+            return
+
         with open(self._filePath, 'w', encoding="utf8") as settingsFile:
-            settingsFile.write( json.dumps( settingsDict, indent=4 ) )
+            settingsFile.write( settingsStr )
+        RamSettings._savedSettings = settingsStr
 
         log("Settings saved!")
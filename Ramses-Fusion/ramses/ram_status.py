@@ -61,6 +61,16 @@ class RamStatus( RamObject ):
         newStatus = RamStatus( data=newData, create = True )
         return newStatus
 
+    def setValues(self, values):
+        """Sets several values at once (e.g. state, completionRatio, version, published),
+        updating the date and sending the data to the daemon only once"""
+        # Nothing changes, keep the date
+        if self._hasValues(values):
+            return
+        values = dict(values)
+        values["date"] = datetime.now().strftime("%Y-%m-%d- %H:%M:%S")
+        super(RamStatus, self).setValues(values)
+
     def date(self):
         """The date of the latest modification"""
         dateStr = self.get("date", "1818-05-05 00:00:00")
@@ -72,19 +82,13 @@ class RamStatus( RamObject ):
 
     def setCompletionRatio(self, completion):
         """Sets a new completion ratio"""
-        data = self.data()
-        data["completionRatio"] = completion
-        data["date"] = datetime.now().strftime("%Y-%m-%d- %H:%M:%S")
-        self.setData(data)
+        self.setValues({ "completionRatio": completion })
 
     def published(self):
         return self.get("published", False)
 
     def setPublished(self, published=True):
-        data = self.data()
-        data["published"] = published
-        data["date"] = datetime.now().strftime("%Y-%m-%d- %H:%M:%S")
-        self.setData(data)
+        self.setValues({ "published": published })
 
     def state(self):
         """The state"""
@@ -93,10 +97,7 @@ class RamStatus( RamObject ):
 
     def setState(self, state):
         """Sets a new state"""
-        data = self.data()
-        data["state"] = RamObject.getUuid(state)
-        data["date"] = datetime.now().strftime("%Y-%m-%d- %H:%M:%S")
-        self.setData(data)
+        self.setValues({ "state": RamObject.getUuid(state) })
 
     def step(self):
         """The step"""
@@ -139,7 +140,4 @@ class RamStatus( RamObject ):
 
     def setVersion(self, version):
         """Sets the version"""
-        data = self.data()
-        data["version"] = version
-        data["date"] = datetime.now().strftime("%Y-%m-%d- %H:%M:%S")
-        self.setData(data)
+        self.setValues({ "version": version })
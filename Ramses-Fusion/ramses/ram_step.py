@@ -33,9 +33,10 @@ class RamStep( RamObject ):
 
     # project is undocumented and used to improve performance, when called from a RamProject
     @staticmethod
-    def fromPath( path ):
+    def fromPath( path, fileInfo = None ):
         """Creates a step from any path, if possible
-        by extracting step info from the path"""
+        by extracting step info from the path.
+        fileInfo is the RamFileInfo already parsed from this path, if any, to not parse it again"""
         from .ram_status import RamStatus
         from .ramses import Ramses
         RAMSES = Ramses.instance()
@@ -52,8 +53,10 @@ class RamStep( RamObject ):
             return status.step()
         
         # Let's use the file name
-        nm = RamFileInfo()
-        nm.setFilePath(path)
+        nm = fileInfo
+        if nm is None:
+            nm = RamFileInfo()
+            nm.setFilePath(path)
         # Get the project
         project = None
         if nm.project != '' and nm.step !="":
@@ -80,8 +83,10 @@ class RamStep( RamObject ):
         inputPipes = []
         pipes = project.pipes()
 
+        # Compare the uuids directly, without building a step for each pipe
+        uuid = self.uuid()
         for pipe in pipes:
-            if pipe.inputStep() == self:
+            if pipe.get("inputStep", "") == uuid:
                 inputPipes.append(pipe)
 
         return inputPipes
@@ -95,8 +100,10 @@ class RamStep( RamObject ):
         outputPipes = []
         pipes = project.pipes()
 
+        # Compare the uuids directly, without building a step for each pipe
+        uuid = self.uuid()
         for pipe in pipes:
-            if pipe.outputStep() == self:
+            if pipe.get("outputStep", "") == uuid:
                 outputPipes.append(pipe)
 
         return outputPipes
@@ -119,8 +126,7 @@ class RamStep( RamObject ):
             FolderNames.stepTemplates
         ))
 
-        if not os.path.isdir(templatesFolder):
-            os.makedirs(templatesFolder)
+        RamFileManager.ensureFolder( templatesFolder )
 
         return templatesFolder
 
@@ -135,8 +141,7 @@ class RamStep( RamObject ):
             FolderNames.publish
         ))
 
-        if not os.path.isdir(folder):
-            os.makedirs(folder)
+        RamFileManager.ensureFolder( folder )
 
         return folder
 
@@ -146,10 +151,10 @@ class RamStep( RamObject ):
 
         versionFolders = []
 
-        for f in os.listdir(templatesPublishPath):
-            folderPath = RamFileManager.buildPath(( templatesPublishPath, f ))
-            if not os.path.isdir(folderPath): continue
-            versionFolders.append( folderPath )
+        with os.scandir(templatesPublishPath) as entries:
+            for entry in entries:
+                if not entry.is_dir(): continue
+                versionFolders.append( RamFileManager.buildPath(( templatesPublishPath, entry.name )) )
 
         versionFolders.sort(key=RamFileManager._publishVersionFoldersSorter)
 
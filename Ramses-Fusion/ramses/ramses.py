@@ -19,18 +19,17 @@
 #======================= END GPL LICENSE BLOCK ========================
 
 import os
-import yaml
+import time
 from subprocess import Popen, PIPE
 from datetime import datetime, timedelta
 
 from .file_manager import RamFileManager
 from .file_info import RamFileInfo
-from .metadata_manager import RamMetaDataManager
 from .logger import log
-from .constants import LogLevel, Log
+from .constants import LogLevel, Log, MetaDataKeys
 from .daemon_interface import RamDaemonInterface
 from .ram_settings import RamSettings
-from .utils import load_module_from_path
+from .utils import load_module_from_path, loadYaml
 from .constants import ItemType
 
 SETTINGS = RamSettings.instance()
@@ -52,6 +51,15 @@ class Ramses( object ):
 
     _instance = None
 
+    # Cache stuff
+    # The states by short name, listed with __sortedStates: { shortName: RamState }
+    __states = {}
+    # Projects already found by short name: { shortName: (time, RamProject) }
+    __projects = {}
+    # The states sorted by completion ratio, and when they were listed
+    __sortedStates = ()
+    __sortedStatesTime = 0
+
     def __init__(self):
         """
         Ramses is a singleton and cannot be initialized with `Ramses()`. Call Ramses.instance() instead.
@@ -214,10 +222,18 @@ class Ramses( object ):
         return:
             RamProject
         """
+        # Each project of the list needs its own query to get its short name:
+        # keep the projects found for 2 seconds, like the object data
+        cached = Ramses.__projects.get( shortName )
+        if cached is not None and time.time() - cached[0] < 2:
+            return cached[1]
+
         projs = self.projects()
         for p in projs:
             if p.shortName() == shortName:
+                Ramses.__projects[shortName] = ( time.time(), p )
                 return p
+        Ramses.__projects.pop( shortName, None )
         return None
 
     def projects(self):
@@ -239,10 +255,8 @@ class Ramses( object ):
         """
 
         if not self._offline:
-            stts = self.states()
-            for stt in stts:
-                if stt.shortName() == stateShortName:
-                    return stt
+            Ramses.__updateStates()
+            return Ramses.__states.get( stateShortName )
         return None
 
     def states(self):
@@ -251,11 +265,27 @@ class Ramses( object ):
         Returns:
             list of RamState
         """
+        Ramses.__updateStates()
+        return list(Ramses.__sortedStates)
+
+    @staticmethod
+    def __updateStates():
+        """Lists the states again if they were listed more than 2 seconds ago, like the object data.
+        The reply contains the data of all the states: they're sorted and indexed by short name at once"""
         from ramses.ram_state import RamState
+
+        if Ramses.__sortedStates and time.time() - Ramses.__sortedStatesTime < 2:
+            return
+
         states = DAEMON.getObjects( "RamState" )
-        # Order before returning
+        # Ordered for the state selectors
         states.sort( key=RamState.stateSorter )
-        return states
+        statesByShortName = {}
+        for stt in states:
+            statesByShortName.setdefault( stt.shortName(), stt )
+        Ramses.__sortedStates = tuple(states)
+        Ramses.__states = statesByShortName
+        Ramses.__sortedStatesTime = time.time()
 
     def showClient(self):
         """Raises the Ramses Client window, launches the client if it is not already running.
@@ -298,8 +328,13 @@ class Ramses( object ):
 
     def addToRecentFiles( self, file ):
         """Adds the file to the recent file list"""
-        if file in SETTINGS.recentFiles:
-            SETTINGS.recentFiles.pop( SETTINGS.recentFiles.index(file) )
+        # Saving the same file again: nothing changes, don't rewrite the settings
+        if SETTINGS.recentFiles and SETTINGS.recentFiles[0] == file:
+            return
+        try:
+            SETTINGS.recentFiles.remove( file )
+        except ValueError:
+            pass
         SETTINGS.recentFiles.insert(0, file)
         SETTINGS.recentFiles = SETTINGS.recentFiles[0:20]
         SETTINGS.save()
@@ -317,9 +352,11 @@ class Ramses( object ):
 
         okToContinue = True
 
-        # Load item and step
-        item = RamItem.fromPath( filePath )
-        step = RamStep.fromPath( filePath )
+        # Load item and step, parsing the path only once
+        nm = RamFileInfo()
+        nm.setFilePath( filePath )
+        item = RamItem.fromPath( filePath, fileInfo=nm )
+        step = RamStep.fromPath( filePath, fileInfo=nm )
 
         if not item or not step:
             return 1
@@ -327,7 +364,7 @@ class Ramses( object ):
         if not publishOptions:
             publishOptionsStr = step.publishSettings()
             if publishOptionsStr != "":
-                publishOptions = yaml.safe_load( publishOptionsStr )
+                publishOptions = loadYaml( publishOptionsStr )
 
         log("Publishing " + str(item) + " for " + str(step))
 
@@ -337,7 +374,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_publish" in dir(m):
+            if hasattr(m, "before_publish"):
                 okToContinue = m.before_publish(filePath, item, step, publishOptions, showPublishOptions)
                 if okToContinue is False:
                     log("A Script interrupted the publish process before it was run: " + s, LogLevel.Info)
@@ -354,7 +391,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_publish" in dir(m):
+            if hasattr(m, "on_publish"):
                 okToContinue = m.on_publish(filePath, item, step, publishOptions, showPublishOptions)
                 if okToContinue is False:
                     log("A Script interrupted the publish process: " + s, LogLevel.Info)
@@ -373,7 +410,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_update_status" in dir(m):
+            if hasattr(m, "before_update_status"):
                 okToContinue = m.before_update_status(item, status, step)
                 if okToContinue is False:
                     log("A Script interrupted the update process before it was run: " + s, LogLevel.Info)
@@ -390,7 +427,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_update_status" in dir(m):
+            if hasattr(m, "on_update_status"):
                 okToContinue = m.on_update_status(item, status, step)
                 if okToContinue is False:
                     log("A Script interrupted the update process: " + s, LogLevel.Info)
@@ -405,15 +442,18 @@ class Ramses( object ):
 
         okToContinue = True
 
-        item = RamItem.fromPath( filePath )
-        step = RamStep.fromPath( filePath )
+        # Parse the path only once for the item and the step
+        nm = RamFileInfo()
+        nm.setFilePath( filePath )
+        item = RamItem.fromPath( filePath, fileInfo=nm )
+        step = RamStep.fromPath( filePath, fileInfo=nm )
 
         for s in SETTINGS.userScripts:
             if not os.path.isfile(s):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_open" in dir(m):
+            if hasattr(m, "before_open"):
                 okToContinue = m.before_open(  filePath, item,step )
                 if okToContinue is False:
                     log("A Script interrupted the open file process: " + s, LogLevel.Info)
@@ -438,7 +478,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_open" in dir(m):
+            if hasattr(m, "on_open"):
                 okToContinue = m.on_open( filePath, item, step )
                 if okToContinue is False:
                     log("A Script interrupted the open file process: " + s, LogLevel.Info)
@@ -454,19 +494,21 @@ class Ramses( object ):
 
         okToContinue = True
 
-        # Get the current step
-        currentStep = RamStep.fromPath( current_file_path )
         # Get the import options
         if not importOptions and step is not None:
             importOptions = { "formats": [] }
+            # Get the current step, only needed to check the pipes
+            currentStep = RamStep.fromPath( current_file_path )
+            # The current step doesn't change while checking the pipes
+            currentStepShortName = currentStep.shortName() if currentStep is not None else None
             for p in step.outputPipes():
                 log("Checking pipe: " + str(p), LogLevel.Debug)
-                if currentStep is None or currentStep.shortName() == p.inputStepShortName():
+                if currentStepShortName is None or currentStepShortName == p.inputStepShortName():
                     for f in p.pipeFiles():
                         optionsStr = f.customSettings()
                         log("Found options:\n" + optionsStr, LogLevel.Debug)
                         if optionsStr != "":
-                            options = yaml.safe_load( optionsStr )
+                            options = loadYaml( optionsStr )
                             importOptions['formats'].append( options )
 
         for s in SETTINGS.userScripts:
@@ -474,7 +516,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_import_item" in dir(m):
+            if hasattr(m, "before_import_item"):
                 okToContinue = m.before_import_item( import_file_paths, item, step, importOptions, showImportOptions )
                 if okToContinue is False:
                     log("A Script interrupted the import process before it was run: " + s, LogLevel.Info)
@@ -490,7 +532,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_import_item" in dir(m):
+            if hasattr(m, "on_import_item"):
                 okToContinue = m.on_import_item( import_file_paths, item, step, importOptions, showImportOptions )
                 if okToContinue is False:
                     log("A Script interrupted the import process: " + s, LogLevel.Info)
@@ -504,19 +546,21 @@ class Ramses( object ):
 
         okToContinue = True
 
-        # Get the current step
-        currentStep = RamStep.fromPath( current_file_path )
         extension = os.path.splitext(filePath)[1][1:]
 
         # Get options
         if not importOptions:
             importOptions = { "formats": [] }
+            # Get the current step, only needed to check the pipes
+            currentStep = RamStep.fromPath( current_file_path )
+            # The current step doesn't change while checking the pipes
+            currentStepShortName = currentStep.shortName() if currentStep is not None else None
             for p in step.outputPipes():
-                if currentStep is None or currentStep.shortName() == p.inputStepShortName():
+                if currentStepShortName is None or currentStepShortName == p.inputStepShortName():
                     for f in p.pipeFiles():
                         optionStr = f.customSettings()
                         if optionStr != "":
-                            options = yaml.safe_load( optionStr )
+                            options = loadYaml( optionStr )
                             if 'formats' not in importOptions:
                                 continue
                             if options['format'] == extension:
@@ -532,7 +576,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_replace_item" in dir(m):
+            if hasattr(m, "before_replace_item"):
                 okToContinue = m.before_replace_item( filePath, item, step, importOptions, showImportOptions )
                 if okToContinue is False:
                     log("A Script interrupted the replace process before it was run: " + s, LogLevel.Info)
@@ -548,7 +592,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_replace_item" in dir(m):
+            if hasattr(m, "on_replace_item"):
                 okToContinue = m.on_replace_item(  filePath, item,step, importOptions, showImportOptions )
                 if okToContinue is False:
                     log("A Script interrupted the replace process: " + s, LogLevel.Info)
@@ -592,8 +636,10 @@ class Ramses( object ):
         if saveFilePath == '':
             return 1
 
+        # Get the latest and previous versions at once
+        versionInfo, prevVersionInfo = RamFileManager.getLatestVersionInfos( saveFilePath )
+
         # If the timeout has expired, we're also incrementing
-        prevVersionInfo = RamFileManager.getLatestVersionInfo( saveFilePath, previous=True )
         modified = prevVersionInfo.date
         now = datetime.today()
         timeout = timedelta(seconds = SETTINGS.autoIncrementTimeout * 60 )
@@ -602,12 +648,11 @@ class Ramses( object ):
             incrementVersion = True
             returnCode = 4
 
-        # Get the RamItem and RamStep
-        item = RamItem.fromPath( filePath )
-        step = RamStep.fromPath( filePath )
+        # Get the RamItem and RamStep, the path has already been parsed
+        item = RamItem.fromPath( filePath, fileInfo=nm )
+        step = RamStep.fromPath( filePath, fileInfo=nm )
 
         # Get the version
-        versionInfo = RamFileManager.getLatestVersionInfo( saveFilePath )
         version = versionInfo.version
         if incrementVersion:
             version += 1
@@ -632,7 +677,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_save" in dir(m):
+            if hasattr(m, "before_save"):
                 okToContinue = m.before_save( saveFilePath, item, step, version, comment, incrementVersion )
                 if okToContinue is False:
                     log("A Script interrupted the save process: " + s, LogLevel.Info)
@@ -650,17 +695,21 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_save" in dir(m):
+            if hasattr(m, "on_save"):
                 okToContinue = m.on_save( saveFilePath, item, step, version, comment, incrementVersion )
                 if okToContinue is False:
                     log("A Script interrupted the save process: " + s, LogLevel.Info)
                     return -1
 
+        # The comment is written with the version history, in the same metadata write
+        # A new version file has no metadata yet: no need to set an empty comment
+        versionMetaData = None
+        if comment is not None or not incrementVersion:
+            versionMetaData = { MetaDataKeys.COMMENT: comment }
+
         # Backup / Increment
-        backupFilePath = RamFileManager.copyToVersion( saveFilePath, incrementVersion, newStateShortName )
+        RamFileManager.copyToVersion( saveFilePath, incrementVersion, newStateShortName, versionMetaData )
 
-        # Write the comment
-        RamMetaDataManager.setComment( backupFilePath, comment )
         if comment is not None and incrementReason == "":
             log( "I've added this comment to the current version: " + comment )
         elif incrementReason != "":
@@ -692,16 +741,13 @@ class Ramses( object ):
         nm.resource = resource
         fileName = nm.fileName()
 
-        if not os.path.isdir(folderPath):
-            os.makedirs(folderPath)
+        RamFileManager.ensureFolder( folderPath )
 
         filePath = os.path.join(folderPath, fileName)
         # Check if file exists
         if os.path.isfile( filePath ):
-            # Backup
-            backupFilePath = RamFileManager.copyToVersion( filePath, increment=True )
-            # Be kind, set a comment
-            RamMetaDataManager.setComment( backupFilePath, "Overwritten by an external file." )
+            # Backup, and be kind, set a comment
+            RamFileManager.copyToVersion( filePath, increment=True, metaData={ MetaDataKeys.COMMENT: "Overwritten by an external file." } )
             log( 'I\'ve added this comment for you: "Overwritten by an external file."' )
             returnCode = 1
 
@@ -711,7 +757,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_save_as" in dir(m):
+            if hasattr(m, "before_save_as"):
                 okToContinue = m.before_save_as( filePath, item, step, resource )
                 if okToContinue is False:
                     log("A Script interrupted the save as process: " + s, LogLevel.Info)
@@ -729,7 +775,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_save_as" in dir(m):
+            if hasattr(m, "on_save_as"):
                 okToContinue = m.on_save_as( filePath, item, step, resource )
                 if okToContinue is False:
                     log("A Script interrupted the save as process: " + s, LogLevel.Info)
@@ -770,8 +816,7 @@ class Ramses( object ):
         nm.extension = fileExtension
         saveName = nm.fileName()
 
-        if not os.path.isdir( saveFolder ):
-            os.makedirs(saveFolder)
+        RamFileManager.ensureFolder( saveFolder )
         saveFilePath = RamFileManager.buildPath((
             saveFolder,
             saveName
@@ -785,7 +830,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "before_save_template" in dir(m):
+            if hasattr(m, "before_save_template"):
                 okToContinue = m.before_save_template( saveFilePath, item, step, templateName )
                 if okToContinue is False:
                     log("A Script interrupted the save template process: " + s, LogLevel.Info)
@@ -803,7 +848,7 @@ class Ramses( object ):
                 log("Sorry, I can't find and run this user script: " + s, LogLevel.Critical)
                 continue
             m = load_module_from_path(s)
-            if "on_save_template" in dir(m):
+            if hasattr(m, "on_save_template"):
                 okToContinue = m.on_save_template( saveFilePath, item, step, templateName )
                 if okToContinue is False:
                     log("A Script interrupted the save template process: " + s, LogLevel.Info)
@@ -18,9 +18,23 @@
 #
 #======================= END GPL LICENSE BLOCK ========================
 
+import copy
 import importlib.util
+import os
+import re
 import sys
+from functools import lru_cache
 from uuid import uuid4
+import yaml
+
+# Use the C parser when PyYAML was built with libyaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# The RegEx reserved characters escaped by escapeRegEx
+RE_RESERVED_CHARS = re.compile(r'([\[.*+\-?^=!:${|}\]\\/()])')
 
 def getDate( e ):
     """Used in RamItem.getStepHistory to sort the list"""
@@ -28,32 +42,51 @@ def getDate( e ):
 
 def escapeRegEx( string ):
     """Escapes reserved RegEx characters from a string"""
-    reservedChars = "[.*+-?^=!:${|}[]\\/()"
-    result = ""
-    for char in string:
-        if char in reservedChars:
-            result = result + "\\" + char
-        else:
-            result = result + char
-    return result
+    return RE_RESERVED_CHARS.sub( r'\\\1', string )
 
 def intToStr( i, numDigits=3):
     """Converts an int to a string, prepending zeroes"""
-    intStr = str(i)
-    while len(intStr) < numDigits:
-        intStr = '0' + intStr
-    return intStr
+    return str(i).zfill(numDigits)
 
 def removeDuplicateObjectsFromList( l ):
-    """Removes duplcates from a list"""
+    """Removes duplicate RamObjects from a list"""
+    # RamObjects are equal when their uuids are equal:
+    # probe a set of uuids instead of the new list
     newList = []
+    uuids = set()
     for i in l:
-        if not i in newList:
-            newList.append(i)
+        uuid = i.uuid()
+        if uuid in uuids:
+            continue
+        uuids.add(uuid)
+        newList.append(i)
     return newList
 
-def load_module_from_path( py_path ):
-    """Loads a py file as a module and returns the new module's namespace"""
+# Modules loaded by load_module_from_path with reuse=True: { py_path: (mtime, module) }
+_loaded_modules = {}
+
+def load_module_from_path( py_path, reuse=False ):
+    """Loads a py file as a module and returns the new module's namespace.
+    The file is executed again on each call, so each run starts with a fresh module state.
+    With reuse=True, the module from a previous call is returned as long as the file has not changed:
+    its top-level code runs only once and its module-level variables are kept between calls."""
+    if not reuse:
+        return _exec_module_from_path( py_path )
+
+    try:
+        mtime = os.path.getmtime( py_path )
+    except OSError:
+        mtime = None
+    loaded = _loaded_modules.get( py_path )
+    if loaded is not None and mtime is not None and loaded[0] == mtime:
+        return loaded[1]
+
+    user_module = _exec_module_from_path( py_path )
+    _loaded_modules[py_path] = (mtime, user_module)
+    return user_module
+
+def _exec_module_from_path( py_path ):
+    """Low-level, undocumented. Executes a py file as a new module and returns its namespace"""
     user_module_uuid = uuid4()
     user_module_name = "dupyf_user_module." + user_module_uuid.hex
     user_module_spec = importlib.util.spec_from_file_location(user_module_name, py_path)
@@ -61,3 +94,14 @@ def load_module_from_path( py_path ):
     sys.modules[user_module_name] = user_module
     user_module_spec.loader.exec_module(user_module)
     return user_module
+
+@lru_cache(maxsize=128)
+def _parseYaml( yamlStr ):
+    """Low-level, undocumented. Parses a yaml document; results are cached by content."""
+    return yaml.load( yamlStr, Loader=YamlLoader )
+
+def loadYaml( yamlStr ):
+    """Parses a yaml document (publish settings, pipe settings...).
+    Identical documents (e.g. settings shared by several steps) are parsed only once;
+    a copy is returned so that callers can safely modify the result"""
+    return copy.deepcopy( _parseYaml( yamlStr ) )